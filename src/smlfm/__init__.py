@@ -1,4 +1,5 @@
 from .config import Config
+from .count_unique_frames import count_unique_frames
 from .fiji_app import FijiApp
 from .fitting import Fitting
 from .fourier_microscope import FourierMicroscope
@@ -9,6 +10,7 @@ from .output_files import OutputFiles
 
 __all__ = [
     "Config",
+    "count_unique_frames",
     "FijiApp",
     "Fitting",
     "FourierMicroscope",
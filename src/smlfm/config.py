@@ -9,6 +9,11 @@ from .localisation_file import LocalisationFile
 from .localisations import Localisations
 from .micro_lens_array import MicroLensArray
 
+# Text forms of field types converted by `Config.from_json()`, created once
+_OPTIONAL_PATH_REPR = repr(Optional[Path])
+_TUPLE_REPR = repr(Tuple[float, float])
+_OPTIONAL_TUPLE_REPR = repr(Optional[Tuple[float, float]])
+
 
 @dataclass
 # pylint: disable=too-many-instance-attributes
@@ -207,6 +212,11 @@ class Config:
     _show_mla_alignment_graph_doc: str = (
         'Show micro-lenses together with localisations.')
     show_mla_alignment_graph: bool = True
+    _show_mla_alignment_max_points_doc: str = (
+        'In the graph with micro-lenses show at most this number of localisations,\n'
+        'randomly selected, to keep drawing of large data fast.\n'
+        'If set to \'null\', all localisations are shown.')
+    show_mla_alignment_max_points: Optional[int] = 100000
     _show_all_debug_graphs_doc: str = (
         'Show all remaining graphs.')
     show_all_debug_graphs: bool = False
@@ -261,12 +271,13 @@ class Config:
                 continue
 
             value = getattr(cfg, f.name)
-            if repr(f.type) == repr(Optional[Path]):
+            type_repr = repr(f.type)
+            if type_repr == _OPTIONAL_PATH_REPR:
                 if value is not None:
                     setattr(cfg, f.name, Path(value))
-            elif repr(f.type) == repr(Tuple[float, float]):
+            elif type_repr == _TUPLE_REPR:
                 setattr(cfg, f.name, tuple(value))
-            elif repr(f.type) == repr(Optional[Tuple[float, float]]):
+            elif type_repr == _OPTIONAL_TUPLE_REPR:
                 if value is not None:
                     setattr(cfg, f.name, tuple(value))
             elif f.type is LocalisationFile.Format:
@@ -0,0 +1,21 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def count_unique_frames(frames: npt.NDArray[float]) -> int:
+    """Count distinct frame numbers in a column of localisation data.
+
+    Frame numbers are integers stored as floats. Non-finite values, e.g. NaN
+    from empty cells in CSV file, are not counted. Compact frame ranges are
+    counted without sorting, sparse ones fall back to `np.unique`.
+    """
+    frames = frames[np.isfinite(frames)]
+    if frames.size == 0:
+        return 0
+
+    frame_min = frames.min()
+    span = frames.max() - frame_min + 1
+    if span > 4 * frames.size + 1024:
+        return int(np.unique(frames).shape[0])
+    frame_ids = (frames - frame_min).astype(np.intp)
+    return int(np.count_nonzero(np.bincount(frame_ids)))
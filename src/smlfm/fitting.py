@@ -132,6 +132,12 @@ class Fitting:
         frame = min_frame
         progress_next_frame = min_frame + progress_step
 
+        # Every task gets only the localisations from its frame range, so the whole
+        # array isn't pickled to each worker. The stable sort keeps the order of
+        # localisations within every frame unchanged.
+        sorted_locs_2d = locs_2d[np.argsort(locs_2d[:, 0], kind='stable')]
+        sorted_frames = sorted_locs_2d[:, 0]
+
         processes = worker_count if worker_count > 0 else None
         with mp.Pool(processes=processes) as pool:
             procs = [Optional[mp.Process]] * task_count
@@ -142,10 +148,13 @@ class Fitting:
                     frame_min=min_frame + frames_per_task * idx,
                     frame_max=min(min_frame + frames_per_task * (idx + 1), max_frame),
                 )
+                row_min, row_max = (
+                    np.searchsorted(sorted_frames, fit_params_n.frame_min, side='left'),
+                    np.searchsorted(sorted_frames, fit_params_n.frame_max, side='right'))
                 # Cannot pass the `abort_event` to processes, otherwise following
                 # runtime error is raised: "Conditional objects should only be
                 # shared between processes through inheritance"
-                args = (locs_2d, rho_scaling, fit_params_n, None)
+                args = (sorted_locs_2d[row_min:row_max], rho_scaling, fit_params_n, None)
                 procs[idx] = pool.apply_async(Fitting._light_field_fit_task, args)
 
             for idx in range(task_count):
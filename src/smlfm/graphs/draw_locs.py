@@ -18,7 +18,8 @@ def draw_locs(fig: Figure,
               lens_centres: Optional[npt.NDArray[float]] = None,
               mla_centre: Optional[npt.NDArray[float]] = None,
               bfp_radius: Optional[float] = None,
-              set_default_size: bool = True
+              set_default_size: bool = True,
+              max_points: Optional[int] = None
               ) -> Figure:
     fig.clear(True)
     if set_default_size:
@@ -31,6 +32,13 @@ def draw_locs(fig: Figure,
 
     lens_idx_uni = np.unique(lens_idx).astype(int)
 
+    # Large data is drawn as a random subset of points that looks the same,
+    # the colour bar and lens labels still include all lenses
+    if max_points is not None and 0 < max_points < xy.shape[0]:
+        rows = np.random.default_rng(0).choice(xy.shape[0], size=max_points, replace=False)
+        xy = xy[rows, :]
+        lens_idx = lens_idx[rows]
+
     cbar_lenses = lens_idx_uni
     cbar_labels = [str(i) for i in cbar_lenses]
     cbar_bounds = np.concatenate((cbar_lenses, [cbar_lenses[-1] + 1])) - 0.5
@@ -49,7 +57,22 @@ def draw_locs(fig: Figure,
                      edgecolor='purple', alpha=0.25)
         ax.add_patch(bfp)
 
-    ax.scatter(xy[:, 0], xy[:, 1], s=1, c=lens_idx, marker=',', lw=0)
+    # Localisations are drawn as markers of one colour per lens, it renders
+    # several times faster than a collection with colour per point
+    order = np.argsort(lens_idx, kind='stable')
+    sorted_lens_idx = lens_idx[order]
+    starts = np.searchsorted(sorted_lens_idx, lens_idx_uni, side='left')
+    ends = np.searchsorted(sorted_lens_idx, lens_idx_uni, side='right')
+    # Separate contiguous columns, the slices per lens are not strided
+    sorted_x = xy[order, 0]
+    sorted_y = xy[order, 1]
+    lens_colours = cm.ScalarMappable(
+        norm=colors.Normalize(vmin=lens_idx_uni[0], vmax=lens_idx_uni[-1])
+    ).to_rgba(lens_idx_uni)
+    for start, end, colour in zip(starts, ends, lens_colours):
+        ax.plot(sorted_x[start:end], sorted_y[start:end],
+                linestyle='none', marker=',', markeredgewidth=0,
+                color=colour, zorder=1)  # Keep the lens overlay on top like before
 
     if mla_centre is not None:
         ax.scatter(mla_centre[0], mla_centre[1],
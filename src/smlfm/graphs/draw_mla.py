@@ -41,7 +41,10 @@ def draw_mla(fig: Figure,
                     xytext=(1.5, 1.0),
                     alpha=0.5,
                     textcoords='offset points',
-                    size=10)
+                    size=10,
+                    # Labels lie inside the axes, measuring each of them
+                    # in tight layout only slows down every redraw
+                    in_layout=False)
 
     ax.set_aspect('equal')
     add_watermark(fig)
@@ -11,6 +11,12 @@ from sklearn.neighbors import NearestNeighbors
 from .fourier_microscope import FourierMicroscope
 from .micro_lens_array import MicroLensArray
 
+_HAS_NUMBA: bool = True
+try:
+    import numba
+except ImportError:
+    _HAS_NUMBA = False
+
 
 class Localisations:
     """A class containing light field localisation data.
@@ -56,13 +62,17 @@ class Localisations:
         INTEGRATE_SPHERE = 3
 
     def __init__(self,
-                 locs_2d_csv: npt.NDArray[float]
+                 locs_2d_csv: npt.NDArray[float],
+                 centre_xy: bool = False
                  ):
         """Constructs light field localisation data object.
 
         Args:
             locs_2d_csv (npt.NDArray[float]):
                 A localisation data read from localisation file.
+            centre_xy (bool):
+                If True, X and Y coordinates are centred to their means
+                while being copied.
         """
 
         self.min_frame = int(np.min(locs_2d_csv[:, 0]))
@@ -70,8 +80,13 @@ class Localisations:
 
         self.locs_2d = np.zeros((locs_2d_csv.shape[0], 13))
 
-        self.locs_2d[:, 0] = locs_2d_csv[:, 0].copy()
-        self.locs_2d[:, 3:10] = locs_2d_csv[:, 1:8].copy()
+        self.locs_2d[:, 0] = locs_2d_csv[:, 0]
+        if centre_xy:
+            xy = locs_2d_csv[:, 1:3]
+            np.subtract(xy, xy.mean(axis=0), out=self.locs_2d[:, 3:5])
+            self.locs_2d[:, 5:10] = locs_2d_csv[:, 3:8]
+        else:
+            self.locs_2d[:, 3:10] = locs_2d_csv[:, 1:8]
         # The locs_2d columns 1, 2, 12 are initialized in assign_to_lenses()
         # The locs_2d columns 10, 11 remain zeroed
         # The filtered_locs_2d columns 10, 11 are initialized in init_alpha_uv()
@@ -93,20 +108,131 @@ class Localisations:
                 An instance of fourier light field microscope class.
         """
 
-        xy = self.locs_2d[:, 3:5].copy()
-        xy *= lfm.xy_to_uv_scale
-
         lens_centres = mla.lens_centres - mla.centre
         lens_centres *= lfm.mla_to_uv_scale
 
-        knn = NearestNeighbors(n_neighbors=1).fit(lens_centres)
-        lens_indices = knn.kneighbors(xy, return_distance=False)
-
-        self.locs_2d[:, 1:3] = lens_centres[lens_indices, :][:, 0, :]  # U, V
-        self.locs_2d[:, 12] = lens_indices[:, 0]
+        if _HAS_NUMBA:
+            # Fills U, V and lens index columns in one pass over the rows
+            _assign_to_lenses_kernel(self.locs_2d, lfm.xy_to_uv_scale, lens_centres)
+        else:
+            xy = self.locs_2d[:, 3:5].copy()
+            xy *= lfm.xy_to_uv_scale
+
+            # The KD-tree is queried only with points not resolved on lattice
+            lens_indices = self._nearest_lens_on_lattice(xy, lens_centres)
+            if lens_indices is None:
+                misses = slice(None)
+                lens_indices = np.empty(xy.shape[0], dtype=np.intp)
+            else:
+                misses = np.flatnonzero(lens_indices < 0)
+            if lens_indices[misses].size > 0:
+                # A KD-tree built once over the lenses, queried on all CPUs
+                knn = NearestNeighbors(n_neighbors=1, algorithm='kd_tree',
+                                       n_jobs=-1).fit(lens_centres)
+                lens_indices[misses] = knn.kneighbors(
+                    xy[misses], return_distance=False)[:, 0]
+
+            self.locs_2d[:, 1:3] = lens_centres[lens_indices, :]  # U, V
+            self.locs_2d[:, 12] = lens_indices
 
         self.reset_filtered_locs()
 
+    @staticmethod
+    def compile_kernels() -> None:
+        """Compile the optional Numba kernels in advance.
+
+        The first call of a kernel compiles it, or loads it from disk cache,
+        which takes a while. Calling this function on background thread early
+        keeps that delay out of the first mapping. Without Numba it does nothing.
+        """
+
+        if _HAS_NUMBA:
+            # The same argument types as in `assign_to_lenses()`
+            _assign_to_lenses_kernel(np.zeros((1, 13)), 1.0, np.zeros((1, 2)))
+
+    @staticmethod
+    def _nearest_lens_on_lattice(xy: npt.NDArray[float],
+                                 lens_centres: npt.NDArray[float]
+                                 ) -> Optional[npt.NDArray[int]]:
+        """Find index of the nearest lens via inverse of the lattice basis.
+
+        The lens centres are expected in a square grid of lattice points
+        as generated by `MicroLensArray`, possibly rotated and shifted.
+        The lattice basis is reduced to two shortest vectors with non-obtuse
+        angle. Every cell of such basis splits into two non-obtuse triangles,
+        so the nearest lattice point is always one of four corners of the cell
+        with the point and no distances to other lenses are needed.
+
+        Returns:
+            Lens indices, or None if the lens centres do not form a regular
+            lattice. The points with nearest lattice point outside the array
+            get -1.
+        """
+
+        lens_count = lens_centres.shape[0]
+        n = int(round(np.sqrt(lens_count)))
+        if n < 2 or n * n != lens_count:
+            return None
+
+        origin = lens_centres[0]
+        b1 = lens_centres[n] - origin
+        b2 = lens_centres[1] - origin
+        # Lagrange-Gauss reduction, the grid vectors may be long and skewed
+        for _ in range(100):
+            if np.dot(b1, b1) > np.dot(b2, b2):
+                b1, b2 = b2, b1
+            if np.dot(b1, b1) == 0:
+                break  # Degenerate basis, rejected with its inverse below
+            k = np.rint(np.dot(b1, b2) / np.dot(b1, b1))
+            if k == 0:
+                break
+            b2 = b2 - k * b1
+        else:
+            return None
+        if np.dot(b1, b2) < 0:
+            b2 = -b2  # Non-obtuse basis, required for the corners check
+        basis = np.column_stack((b1, b2))
+        try:
+            basis_inv = np.linalg.inv(basis)
+        except np.linalg.LinAlgError:
+            return None
+
+        lens_ij = np.rint((lens_centres - origin) @ basis_inv.T).astype(np.intp)
+        if not np.allclose(lens_ij @ basis.T + origin, lens_centres,
+                           rtol=0, atol=1e-6 * np.linalg.norm(b1)):
+            return None
+        ij_min = lens_ij.min(axis=0)
+        lens_ij -= ij_min
+        shape = lens_ij.max(axis=0) + 1
+        table = np.full(shape, -1, dtype=np.intp)
+        table[lens_ij[:, 0], lens_ij[:, 1]] = np.arange(lens_count)
+        if np.count_nonzero(table >= 0) != lens_count:
+            return None  # Some lenses share lattice point
+
+        # Split lattice coordinates to cell and position within the cell
+        f = (xy - origin) @ basis_inv.T
+        cells = np.floor(f)
+        f -= cells
+
+        # Squared distances to cell corners using the metric of the basis
+        gram = basis.T @ basis
+        corners = np.array([[0, 0], [1, 0], [0, 1], [1, 1]], dtype=np.intp)
+        dist_sq = np.empty((xy.shape[0], corners.shape[0]))
+        for k, (a, b) in enumerate(corners):
+            du = f[:, 0] - a
+            dv = f[:, 1] - b
+            dist_sq[:, k] = (gram[0, 0] * du * du + 2 * gram[0, 1] * du * dv
+                             + gram[1, 1] * dv * dv)
+
+        ij = cells.astype(np.intp)
+        ij += corners[np.argmin(dist_sq, axis=1)]
+        ij -= ij_min
+        inside = np.all((ij >= 0) & (ij < shape), axis=1)
+        lens_indices = np.full(xy.shape[0], -1, dtype=np.intp)
+        lens_indices[inside] = table[ij[inside, 0], ij[inside, 1]]
+
+        return lens_indices
+
     def _filter(self,
                 filter_range: Tuple[float, float],
                 column_data: npt.NDArray[float]
@@ -128,10 +254,12 @@ class Localisations:
         radius_sq = radius ** 2
         centres = mla.lens_centres - mla.centre
         distance_sq = np.sum(centres ** 2, axis=1)
-        lens_indices = np.nonzero(distance_sq < radius_sq)[0]
+        lens_mask = distance_sq < radius_sq
 
-        index = self.filtered_locs_2d[:, 12]
-        sel = np.any(index[:, None] == lens_indices, axis=-1)
+        # Lens indices are small non-negative integers, look them up in the mask
+        # in one pass over the column instead of comparing with every lens
+        index = self.filtered_locs_2d[:, 12].astype(np.intp)
+        sel = lens_mask[index]
         self.filtered_locs_2d = self.filtered_locs_2d[sel, :]
 
     def filter_rhos(self,
@@ -354,3 +482,34 @@ class Localisations:
                 warnings.simplefilter("ignore", category=RuntimeWarning)
                 alpha_uv[i, 0] = np.nanmean(um * phi)
                 alpha_uv[i, 1] = np.nanmean(vm * phi)
+
+
+if _HAS_NUMBA:
+    @numba.njit(parallel=True, cache=True, nogil=True)
+    def _assign_to_lenses_kernel(locs_2d: npt.NDArray[float],
+                                 xy_scale: float,
+                                 lens_centres: npt.NDArray[float]
+                                 ) -> None:
+        """Map every scaled X,Y point to the nearest lens.
+
+        The U,V columns get the lens centre and the last column its index.
+        There are only tens of lenses, a brute force search over all of them
+        in parallel loop over the points is faster than a KD-tree query.
+        Only arrays and numbers are accessed, so the GIL is released and
+        the GUI thread keeps running during the mapping.
+        """
+        for i in numba.prange(locs_2d.shape[0]):  # pylint: disable=not-an-iterable
+            u = locs_2d[i, 3] * xy_scale
+            v = locs_2d[i, 4] * xy_scale
+            best_idx = 0
+            best_dist_sq = np.inf
+            for j in range(lens_centres.shape[0]):
+                du = u - lens_centres[j, 0]
+                dv = v - lens_centres[j, 1]
+                dist_sq = du * du + dv * dv
+                if dist_sq < best_dist_sq:
+                    best_dist_sq = dist_sq
+                    best_idx = j
+            locs_2d[i, 1] = lens_centres[best_idx, 0]
+            locs_2d[i, 2] = lens_centres[best_idx, 1]
+            locs_2d[i, 12] = best_idx
@@ -121,3 +121,26 @@ class MicroLensArray:
         # Shift origin back to centre
         self.lens_centres[:, 0] += self.centre[0]
         self.lens_centres[:, 1] += self.centre[1]
+
+    def transform_lattice(self,
+                          theta: float,
+                          dxy: npt.NDArray[float]
+                          ) -> None:
+        """Rotate the coordinates of the micro-lenses centers and shift them.
+
+        It does the same as `rotate_lattice()` followed by `offset_lattice()`,
+        but with one matrix product instead of several passes over the array.
+
+        Args:
+            theta (float): An angle to rotate around the centre (in radians).
+            dxy (npt.NDArray[float]): A shift in X and Y directions
+                (in lattice spacing units).
+        """
+
+        cos_theta = np.cos(theta)
+        sin_theta = np.sin(theta)
+        rotation = np.array([[cos_theta, -sin_theta],
+                             [sin_theta, cos_theta]])
+        # Rotate around the centre, shift origin back to centre and offset
+        self.lens_centres[:] = ((self.lens_centres - self.centre) @ rotation.T
+                                + (self.centre + dxy))
@@ -16,7 +16,7 @@ import smlfm.graphs
 
 # pylint: disable=too-many-branches,too-many-statements
 def app():
-    tic_total = time.time()
+    tic_total = time.perf_counter()
     user_interaction_time = 0
     timestamp = datetime.now()
 
@@ -89,28 +89,22 @@ def app():
 
     # 2. Read localisation file
 
-    tic = time.time()
+    tic = time.perf_counter()
 
     csv = smlfm.LocalisationFile(cfg.csv_file, cfg.csv_format)
     csv.read()
 
     print(f'Loaded {csv.data.shape[0]} localisations from'
-          f' {np.unique(csv.data[:, 0]).shape[0]} unique frames')
+          f' {smlfm.count_unique_frames(csv.data[:, 0])} unique frames')
 
     if cfg.show_graphs and cfg.show_all_debug_graphs:
         fig = smlfm.graphs.draw_locs_csv(plt.figure(), csv.data[:, 1:3])
         fig.canvas.manager.set_window_title('Raw localisations')
 
     csv.scale_peakfit_data(lfm.pixel_size_sample)
-    locs_2d_csv = csv.data.copy()
-
-    # Center X and Y to their means
-    # TODO: Why center the data to means? Ensure how is this related to MLA centre.
-    locs_2d_csv[:, 1] -= locs_2d_csv[:, 1].mean()
-    locs_2d_csv[:, 2] -= locs_2d_csv[:, 2].mean()
 
     if cfg.log_timing:
-        print(f'Loading {repr(cfg.csv_file.name)} took {1e3 * (time.time() - tic):.3f} ms')
+        print(f'Loading {repr(cfg.csv_file.name)} took {1e3 * (time.perf_counter() - tic):.3f} ms')
 
     # 3. Prepare MLA and rotate it to match the CSV data
 
@@ -122,8 +116,8 @@ def app():
         fig = smlfm.graphs.draw_mla(plt.figure(), mla.lens_centres, mla.centre)
         fig.canvas.manager.set_window_title('Micro-lens array centres')
 
-    mla.rotate_lattice(np.deg2rad(cfg.mla_rotation))
-    mla.offset_lattice(np.array(cfg.mla_offset) / lfm.mla_to_xy_scale)  # XY -> MLA
+    mla.transform_lattice(np.deg2rad(cfg.mla_rotation),
+                          np.array(cfg.mla_offset) / lfm.mla_to_xy_scale)  # XY -> MLA
 
     if cfg.show_graphs and cfg.show_all_debug_graphs:
         fig = smlfm.graphs.draw_mla(plt.figure(), mla.lens_centres, mla.centre)
@@ -131,13 +125,16 @@ def app():
 
     # 4. Map localisations to lenses
 
-    tic = time.time()
+    tic = time.perf_counter()
 
-    lfl = smlfm.Localisations(locs_2d_csv)
+    # The constructor copies the data to a new array, no need to copy it here.
+    # Center X and Y to their means as part of that copy.
+    # TODO: Why center the data to means? Ensure how is this related to MLA centre.
+    lfl = smlfm.Localisations(csv.data, centre_xy=True)
     lfl.assign_to_lenses(mla, lfm)
 
     if cfg.log_timing:
-        print(f'Mapping points to lenses took {1e3 * (time.time() - tic):.3f} ms')
+        print(f'Mapping points to lenses took {1e3 * (time.perf_counter() - tic):.3f} ms')
 
     if cfg.show_graphs and cfg.show_mla_alignment_graph:
         fig = smlfm.graphs.draw_locs(
@@ -146,12 +143,13 @@ def app():
             lens_idx=lfl.locs_2d[:, 12],
             lens_centres=(mla.lens_centres - mla.centre) * lfm.mla_to_xy_scale,
             # U,V values are around MLA centre but that offset is not included
-            mla_centre=np.array([0.0, 0.0]))
+            mla_centre=np.array([0.0, 0.0]),
+            max_points=cfg.show_mla_alignment_max_points)
         fig.canvas.manager.set_window_title('Localisations with lens centers')
 
         # Ask the user to confirm if micro-lenses are correctly aligned
         if cfg.confirm_mla_alignment:
-            tic = time.time()
+            tic = time.perf_counter()
             print('')
             print('Check on the figure that the lenses are well aligned with the'
                   ' data. Then close the window(s) to continue.')
@@ -169,11 +167,11 @@ def app():
                         sys.exit(10)
                     break
             print('')
-            user_interaction_time = time.time() - tic
+            user_interaction_time = time.perf_counter() - tic
 
     # 5. Filter localisations and set alpha model
 
-    tic = time.time()
+    tic = time.perf_counter()
 
     if cfg.filter_lenses:
         lfl.filter_lenses(mla, lfm)
@@ -187,11 +185,11 @@ def app():
     lfl.init_alpha_uv(cfg.alpha_model, lfm, worker_count=cfg.max_workers)
 
     if cfg.log_timing:
-        print(f'Filtering and setting alpha model took {1e3 * (time.time() - tic):.3f} ms')
+        print(f'Filtering and setting alpha model took {1e3 * (time.perf_counter() - tic):.3f} ms')
 
     # 6. Find system aberrations
 
-    tic = time.time()
+    tic = time.perf_counter()
 
     fit_params_cor = dataclasses.replace(
         cfg.fit_params_aberration,
@@ -229,11 +227,11 @@ def app():
         fig.canvas.manager.set_window_title('Corrected localisations')
 
     if cfg.log_timing:
-        print(f'Aberration correction took {1e3 * (time.time() - tic):.3f} ms')
+        print(f'Aberration correction took {1e3 * (time.perf_counter() - tic):.3f} ms')
 
     # 7. Fit full data set on corrected localisations
 
-    tic = time.time()
+    tic = time.perf_counter()
 
     fit_params_all = dataclasses.replace(
         cfg.fit_params_full,
@@ -255,13 +253,13 @@ def app():
                   f' {frame - min_frame + 1}/{max_frame - min_frame + 1}...'))
 
     print(f'Total number of frames used for fitting:'
-          f' {np.unique(locs_3d[:, 7]).shape[0]}')
+          f' {smlfm.count_unique_frames(locs_3d[:, 7])}')
     print(f'Total number of 2D localisations used for fitting:'
           f' {int(np.sum(locs_3d[:, 5]))}')
     print(f'Total number of 3D localisations: {locs_3d.shape[0]}')
 
     if cfg.log_timing:
-        print(f'Complete fitting took {1e3 * (time.time() - tic):.3f} ms')
+        print(f'Complete fitting took {1e3 * (time.perf_counter() - tic):.3f} ms')
 
     # 8. Write the results
 
@@ -308,7 +306,7 @@ def app():
     # End
 
     if cfg.log_timing:
-        total_time = time.time() - tic_total - user_interaction_time
+        total_time = time.perf_counter() - tic_total - user_interaction_time
         print(f'Total time: {1e3 * total_time:.3f} ms')
 
     if cfg.show_graphs:
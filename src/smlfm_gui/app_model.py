@@ -1,6 +1,7 @@
 import sys
 import threading
 import tkinter as tk
+import traceback as tb
 from pathlib import Path
 from queue import Empty, SimpleQueue
 from tkinter import ttk
@@ -82,7 +83,7 @@ class AppModel:
         3. OPTICS stage - Micro-Lens Array & Microscope
             - Invalidate:
                 - Deletes `mla`, `lfm` and `lfl`
-                - Deletes MLA and MAPPED graphs
+                - Hides MLA and MAPPED graphs
                 - Invalidates FILTER stage
             - Update:
                 - Creates `lfm` and `mla` (from `cfg`)
@@ -140,9 +141,17 @@ class AppModel:
         self._root = None
         self._min_root_width: Optional[int] = None
         self._gui_queue: Optional[SimpleQueue] = None
+        # A persistent background thread running stage updates one by one
+        self._worker_thread: Optional[threading.Thread] = None
+        self._worker_queue: SimpleQueue = SimpleQueue()
 
         self.fiji_app = smlfm.FijiApp()
 
+        # Compile kernels while the GUI starts, not in first mapping.
+        # Own thread, so the worker thread is free for stage updates meanwhile.
+        threading.Thread(target=smlfm.Localisations.compile_kernels,
+                         name='smlfm-compile', daemon=True).start()
+
         self.save_timestamp = None
 
         self.cli_cfg_file: Optional[Path] = None
@@ -155,6 +164,8 @@ class AppModel:
         self.csv: Optional[smlfm.LocalisationFile] = None
         self.lfm: Optional[smlfm.FourierMicroscope] = None
         self.mla: Optional[smlfm.MicroLensArray] = None
+        # MLA lens centres in X,Y around MLA centre (in microns), set with `mla`
+        self.xy_lens_centres: Optional[npt.NDArray[float]] = None
         self.lfl: Optional[smlfm.Localisations] = None
 
         self.locs_3d: Optional[npt.NDArray[float]] = None
@@ -256,6 +267,28 @@ class AppModel:
             data.reply_event.wait()
         return data.reply
 
+    def invoke_on_worker_thread_async(self, fn, *args, **kwargs):
+        """Invokes the function on a background worker thread.
+
+        The worker thread is started on first use and then reused, the calls
+        are processed in order of submission. Like a thread for each update
+        used before, it is a daemon thread that does not block the app exit.
+        """
+        if self._worker_thread is None:
+            self._worker_thread = threading.Thread(
+                target=self._worker_thread_fn, name='smlfm-stage', daemon=True)
+            self._worker_thread.start()
+        self._worker_queue.put((fn, args, kwargs))
+
+    def _worker_thread_fn(self):
+        while True:
+            fn, args, kwargs = self._worker_queue.get()
+            try:
+                fn(*args, **kwargs)
+            except BaseException as ex:
+                # Keep the worker alive for next calls
+                tb.print_exception(None, ex, ex.__traceback__)
+
     def _gui_invoke_handler(self, _event):
         try:
             while True:
@@ -301,6 +334,20 @@ class AppModel:
     def graph_exists(self, gt: GraphType) -> bool:
         return self.graphs[gt] is not None
 
+    def hide_graph(self, gt: GraphType) -> bool:
+        """Hide the graph window, but keep it to be redrawn with new data.
+
+        Used instead of `destroy_graph` by stages that reuse their graph
+        windows after invalidation, like the OPTICS stage for MLA and MAPPED
+        graphs.
+
+        Returns True if the graph window exists.
+        """
+        wnd = self.graphs[gt]
+        if wnd is not None:
+            wnd.withdraw()
+        return wnd is not None
+
     def destroy_graph(self, gt: GraphType):
         wnd = self.graphs[gt]
         self.graphs[gt] = None
@@ -3,7 +3,6 @@ import tkinter as tk
 import traceback as tb
 from idlelib.tooltip import Hovertip
 from pathlib import Path
-from threading import Thread
 from tkinter import filedialog, messagebox, ttk
 from typing import Optional
 
@@ -110,7 +109,6 @@ class ConfigFrame(ttk.Frame, IStage):
         self._var_summary = tk.StringVar()
         self._ui_summary_lbl[TEXTVARIABLE] = self._var_summary
 
-        self._update_thread: Optional[Thread] = None
         self._update_thread_err: Optional[str] = None
 
         self._cli_overrides: bool = True  # Resets after first update
@@ -152,7 +150,6 @@ class ConfigFrame(ttk.Frame, IStage):
                 tb.print_exception(None, ex, ex.__traceback__)
 
             def _update_done():
-                self._update_thread = None
                 self.winfo_toplevel().configure(cursor='')
 
                 self._model.stages_ui_updating(False)
@@ -194,8 +191,7 @@ class ConfigFrame(ttk.Frame, IStage):
 
             self._model.invoke_on_gui_thread_async(_update_done)
 
-        self._update_thread = Thread(target=_update_thread_fn, daemon=True)
-        self._update_thread.start()
+        self._model.invoke_on_worker_thread_async(_update_thread_fn)
 
     def stage_ui_init(self):
         # CLI option takes precedence
@@ -3,8 +3,8 @@ import multiprocessing as mp
 import time
 import tkinter as tk
 import traceback as tb
+from functools import partial
 from idlelib.tooltip import Hovertip
-from threading import Thread
 from tkinter import messagebox, ttk
 from typing import Optional
 
@@ -91,7 +91,8 @@ class CorrectFrame(ttk.Frame, IStage):
         self._var_preview = tk.IntVar()
         self._ui_preview[VARIABLE] = self._var_preview
 
-        self._update_thread: Optional[Thread] = None
+        # True while the update task runs on worker thread
+        self._update_running: bool = False
         self._update_thread_err: Optional[str] = None
         self._update_thread_abort: Optional[mp.Event] = None
 
@@ -150,7 +151,7 @@ class CorrectFrame(ttk.Frame, IStage):
                 self._ui_start_tip.text = 'Proceed with correction'
                 self._ui_start.configure(state=tk.DISABLED)
 
-                self._update_thread = None
+                self._update_running = False
                 self.winfo_toplevel().configure(cursor='')
 
                 self._model.stages_ui_updating(False)
@@ -192,8 +193,8 @@ class CorrectFrame(ttk.Frame, IStage):
             self._model.invoke_on_gui_thread_async(_update_done)
 
         self._update_thread_abort = mp.Event()
-        self._update_thread = Thread(target=_update_thread_fn, daemon=True)
-        self._update_thread.start()
+        self._update_running = True
+        self._model.invoke_on_worker_thread_async(_update_thread_fn)
 
     def stage_ui_init(self):
         self._ui_update_done()
@@ -293,7 +294,7 @@ class CorrectFrame(ttk.Frame, IStage):
     def _on_start(self):
         self._var_start.set(0)
 
-        if self._update_thread is not None:
+        if self._update_running:
             if self._update_thread_abort is not None:
                 if not self._update_thread_abort.is_set():
                     self._ui_start.configure(state=tk.DISABLED)
@@ -316,6 +317,14 @@ class CorrectFrame(ttk.Frame, IStage):
         if force_show or force_update:
             self._on_preview(force_update)
 
+    def _on_preview_wnd_map(self, mapped: bool, evt: tk.Event):
+        # The binding on toplevel window is triggered for all its child widgets too
+        if evt.widget is not self._model.graphs[GraphType.CORRECTED]:
+            return
+
+        if self._var_preview.get() != int(mapped):
+            self._var_preview.set(int(mapped))
+
     def _on_preview(self, force_update: bool = False):
 
         def draw(f: Figure, set_size: bool = True) -> Figure:
@@ -323,8 +332,7 @@ class CorrectFrame(ttk.Frame, IStage):
                 f,
                 xy=self._model.lfl.corrected_locs_2d[:, 3:5],
                 lens_idx=self._model.lfl.corrected_locs_2d[:, 12],
-                lens_centres=((self._model.mla.lens_centres - self._model.mla.centre)
-                              * self._model.lfm.mla_to_xy_scale),
+                lens_centres=self._model.xy_lens_centres,
                 # U,V values are around MLA centre but that offset is not included
                 mla_centre=np.array([0.0, 0.0]),
                 set_default_size=set_size)
@@ -334,8 +342,8 @@ class CorrectFrame(ttk.Frame, IStage):
             fig = draw(Figure())
             wnd = FigureWindow(fig, master=self,
                                title='Corrected localisations')
-            wnd.bind('<Map>', func=lambda _evt: self._var_preview.set(1))
-            wnd.bind('<Unmap>', func=lambda _evt: self._var_preview.set(0))
+            wnd.bind('<Map>', func=partial(self._on_preview_wnd_map, True))
+            wnd.bind('<Unmap>', func=partial(self._on_preview_wnd_map, False))
             self._model.graphs[GraphType.CORRECTED] = wnd
         else:
             if force_update:
@@ -349,7 +357,7 @@ class CorrectFrame(ttk.Frame, IStage):
 
     # Executed on thread
     def _update_task(self):
-        tic = time.time()
+        tic = time.perf_counter()
 
         fit_params_cor = dataclasses.replace(
             self._model.cfg.fit_params_aberration,
@@ -395,4 +403,4 @@ class CorrectFrame(ttk.Frame, IStage):
                 return
 
         if self._model.cfg.log_timing:
-            print(f'Aberration correction took {1e3 * (time.time() - tic):.3f} ms')
+            print(f'Aberration correction took {1e3 * (time.perf_counter() - tic):.3f} ms')
@@ -1,13 +1,12 @@
 import time
 import tkinter as tk
 import traceback as tb
+from functools import partial
 from idlelib.tooltip import Hovertip
 from pathlib import Path
-from threading import Thread
 from tkinter import filedialog, messagebox, ttk
 from typing import Optional
 
-import numpy as np
 from matplotlib.figure import Figure
 
 import smlfm
@@ -160,7 +159,6 @@ class CsvFrame(ttk.Frame, IStage):
         self._var_preview = tk.IntVar()
         self._ui_preview[VARIABLE] = self._var_preview
 
-        self._update_thread: Optional[Thread] = None
         self._update_thread_err: Optional[str] = None
 
         self.stage_ui_init()
@@ -197,7 +195,6 @@ class CsvFrame(ttk.Frame, IStage):
                 tb.print_exception(None, ex, ex.__traceback__)
 
             def _update_done():
-                self._update_thread = None
                 self.winfo_toplevel().configure(cursor='')
 
                 self._model.stages_ui_updating(False)
@@ -223,8 +220,7 @@ class CsvFrame(ttk.Frame, IStage):
 
             self._model.invoke_on_gui_thread_async(_update_done)
 
-        self._update_thread = Thread(target=_update_thread_fn, daemon=True)
-        self._update_thread.start()
+        self._model.invoke_on_worker_thread_async(_update_thread_fn)
 
     def stage_ui_init(self):
         if self._model.cfg is not None:
@@ -281,7 +277,7 @@ class CsvFrame(ttk.Frame, IStage):
             if self._model.stage_is_active(self._stage_type_next):
                 self._ui_preview.configure(state=tk.NORMAL)
                 locs = self._model.csv.data.shape[0]
-                frames = np.unique(self._model.csv.data[:, 0]).shape[0]
+                frames = smlfm.count_unique_frames(self._model.csv.data[:, 0])
                 self._var_summary.set(
                     f'Loaded {locs} localisations from {frames} unique frames')
             else:
@@ -367,6 +363,14 @@ class CsvFrame(ttk.Frame, IStage):
         if force_show or force_update:
             self._on_preview(force_update)
 
+    def _on_preview_wnd_map(self, mapped: bool, evt: tk.Event):
+        # The binding on toplevel window is triggered for all its child widgets too
+        if evt.widget is not self._model.graphs[GraphType.CSV_RAW]:
+            return
+
+        if self._var_preview.get() != int(mapped):
+            self._var_preview.set(int(mapped))
+
     def _on_preview(self, force_update: bool = False):
 
         def draw(f: Figure, set_size: bool = True) -> Figure:
@@ -379,8 +383,8 @@ class CsvFrame(ttk.Frame, IStage):
         if wnd is None:
             fig = draw(Figure())
             wnd = FigureWindow(fig, master=self, title='Raw localisations')
-            wnd.bind('<Map>', func=lambda _evt: self._var_preview.set(1))
-            wnd.bind('<Unmap>', func=lambda _evt: self._var_preview.set(0))
+            wnd.bind('<Map>', func=partial(self._on_preview_wnd_map, True))
+            wnd.bind('<Unmap>', func=partial(self._on_preview_wnd_map, False))
             self._model.graphs[GraphType.CSV_RAW] = wnd
         else:
             if force_update:
@@ -431,7 +435,6 @@ class CsvFrame(ttk.Frame, IStage):
                 tb.print_exception(None, ex, ex.__traceback__)
 
             def _update_done():
-                self._update_thread = None
                 self.winfo_toplevel().configure(cursor='')
 
                 self._model.stages_ui_updating(False)
@@ -461,14 +464,13 @@ class CsvFrame(ttk.Frame, IStage):
 
             self._model.invoke_on_gui_thread_async(_update_done)
 
-        self._update_thread = Thread(target=_update_thread_fn, daemon=True)
-        self._update_thread.start()
+        self._model.invoke_on_worker_thread_async(_update_thread_fn)
 
     # Executed on thread
     def _update_task(self):
         self._model.invoke_on_gui_thread_async(
             self._var_summary.set, 'Loading localisations...')
-        tic = time.time()
+        tic = time.perf_counter()
 
         self._model.csv = smlfm.LocalisationFile(
             self._model.cfg.csv_file, self._model.cfg.csv_format)
@@ -476,4 +478,4 @@ class CsvFrame(ttk.Frame, IStage):
 
         if self._model.cfg.log_timing:
             print(f'Loading {repr(self._model.cfg.csv_file.name)} took'
-                  f' {1e3 * (time.time() - tic):.3f} ms')
+                  f' {1e3 * (time.perf_counter() - tic):.3f} ms')
@@ -42,4 +42,5 @@ class FigureWindow(tk.Toplevel):
         self.bind('<Escape>', func=lambda _evt: self.withdraw())
 
     def refresh(self):
-        self.canvas.draw()
+        # Schedule the redraw, multiple refreshes in a row render only once
+        self.canvas.draw_idle()
@@ -4,11 +4,11 @@ import time
 import tkinter as tk
 import traceback as tb
 from datetime import datetime
+from functools import partial
 from idlelib.tooltip import Hovertip
 from pathlib import Path
-from threading import Thread
 from tkinter import filedialog, messagebox, ttk
-from typing import Optional
+from typing import Optional, Set, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -23,6 +23,29 @@ from .figure_window import FigureWindow
 from .fit_cfg_dialog import FitCfgDialog
 
 
+class _LatchedEvent:
+    """A wrapper for `mp.Event` that remembers once the event was set.
+
+    The fitting polls the abort event for every frame. After the event was
+    seen set, further polls don't need to lock the underlying event again.
+    """
+
+    __slots__ = ('_event', '_is_set')
+
+    def __init__(self, event: mp.Event):
+        self._event = event
+        self._is_set = False
+
+    def set(self) -> None:
+        self._is_set = True
+        self._event.set()
+
+    def is_set(self) -> bool:
+        if not self._is_set:
+            self._is_set = self._event.is_set()
+        return self._is_set
+
+
 # pylint: disable=too-many-ancestors,too-many-instance-attributes
 class FitFrame(ttk.Frame, IStage):
 
@@ -153,9 +176,20 @@ class FitFrame(ttk.Frame, IStage):
         self._var_progress = tk.IntVar()
         self._ui_progress[VARIABLE] = self._var_progress
 
-        self._update_thread: Optional[Thread] = None
+        # Preview check button variables and show/hide handlers per graph type
+        self._previews = {
+            GraphType.OCCURRENCES: (self._var_preview_occ, self._on_preview_occ),
+            GraphType.HISTOGRAM: (self._var_preview_hist, self._on_preview_hist),
+            GraphType.LOCS_3D: (self._var_preview_3d, self._on_preview_3d),
+        }
+
+        # True while the update task runs on worker thread
+        self._update_running: bool = False
         self._update_thread_err: Optional[str] = None
-        self._update_thread_abort: Optional[mp.Event] = None
+        self._update_thread_abort: Optional[_LatchedEvent] = None
+
+        # Fitting parameters with frame range resolved at update start
+        self._fit_params_all: Optional[smlfm.Fitting.FitParams] = None
 
         self._settings_dlg: Optional[FitCfgDialog] = None
         self._settings_apply: bool = False
@@ -167,8 +201,24 @@ class FitFrame(ttk.Frame, IStage):
 
         # A cache with locs_3d filtered by max_lateral_err and min_view_count
         self._keep_idx: Optional[npt.NDArray[float]] = None
+        # Columns of locs_3d filtered by `_keep_idx`, shared by all previews
+        self._kept_xyz: Optional[npt.NDArray[float]] = None
+        self._kept_lateral_err: Optional[npt.NDArray[float]] = None
+        self._kept_axial_err: Optional[npt.NDArray[float]] = None
+        self._kept_photons: Optional[npt.NDArray[float]] = None
+        # A cache with number of 3D localisations, frames and 2D localisations used
+        self._summary_stats: Optional[Tuple[int, int, int]] = None
+        # Graphs with outdated content, redrawn once their window is shown
+        self._dirty_graphs: Set[GraphType] = set()
 
         self._saved_path: Optional[Path] = None
+        # A save folder text last stored to `cfg.save_dir`
+        self._last_save_dir_txt: Optional[str] = None
+        # A sub-folder for autosaved results, named at update start
+        self._planned_sub_dir: Optional[Path] = None
+
+        # A state the UI widgets were last updated for by `_ui_update_done`
+        self._ui_state_key: Optional[tuple] = None
 
         self.stage_ui_init()
 
@@ -187,6 +237,9 @@ class FitFrame(ttk.Frame, IStage):
 
         self._model.locs_3d = None
         self._keep_idx = None
+        self._reset_kept_columns()
+        self._summary_stats = None
+        self._dirty_graphs.clear()
         self._saved_path = None
 
         if not self._update_from_settings:
@@ -204,17 +257,18 @@ class FitFrame(ttk.Frame, IStage):
         self.winfo_toplevel().configure(cursor='watch')
 
         self._model.save_timestamp = datetime.now()
+        timestamp_str = self._model.save_timestamp.strftime('%Y%m%d-%H%M%S')
+        self._planned_sub_dir = Path(f'3D Fitting - {timestamp_str}'
+                                     f' - {self._model.cfg.csv_file.name}')
 
         self._ui_start[IMAGE] = self._model.icons.cancel
         self._ui_start_tip.text = 'Abort processing'
         self._ui_start.configure(state=tk.NORMAL)
 
-        frame_min = (self._model.cfg.fit_params_full.frame_min
-                     if self._model.cfg.fit_params_full.frame_min > 0
-                     else self._model.lfl.min_frame)
-        frame_max = (self._model.cfg.fit_params_full.frame_max
-                     if self._model.cfg.fit_params_full.frame_max > 0
-                     else self._model.lfl.max_frame)
+        # Resolved once here and used also by the update thread
+        frame_min, frame_max = self._resolve_frame_range()
+        self._fit_params_all = dataclasses.replace(
+            self._model.cfg.fit_params_full, frame_min=frame_min, frame_max=frame_max)
         self._ui_progress.configure(maximum=frame_max - frame_min + 1)
         self._var_progress.set(0)
 
@@ -230,7 +284,7 @@ class FitFrame(ttk.Frame, IStage):
                 self._ui_start_tip.text = 'Proceed with fitting'
                 self._ui_start.configure(state=tk.DISABLED)
 
-                self._update_thread = None
+                self._update_running = False
                 self.winfo_toplevel().configure(cursor='')
 
                 self._model.stages_ui_updating(False)
@@ -277,11 +331,14 @@ class FitFrame(ttk.Frame, IStage):
 
             self._model.invoke_on_gui_thread_async(_update_done)
 
-        self._update_thread_abort = mp.Event()
-        self._update_thread = Thread(target=_update_thread_fn, daemon=True)
-        self._update_thread.start()
+        self._update_thread_abort = _LatchedEvent(mp.Event())
+        self._update_running = True
+        self._model.invoke_on_worker_thread_async(_update_thread_fn)
 
     def stage_ui_init(self):
+        self._ui_state_key = None
+        self._last_save_dir_txt = None
+
         if self._model.cfg is not None:
             if self._model.cfg.save_dir is None:
                 self._var_autosave_dir_chb.set(0)
@@ -302,6 +359,8 @@ class FitFrame(ttk.Frame, IStage):
             self._ui_update_done()
 
     def _ui_update_start(self):
+        self._ui_state_key = None
+
         self._ui_autosave_dir_chb.configure(state=tk.DISABLED)
         self._ui_save_dir.configure(state=tk.DISABLED)
         self._ui_save_dir_btn.configure(state=tk.DISABLED)
@@ -318,6 +377,19 @@ class FitFrame(ttk.Frame, IStage):
 
     # pylint: disable=too-many-branches
     def _ui_update_done(self):
+        # Nothing to do if the state the UI was last updated for hasn't changed
+        ui_state_key = (
+            self.stage_is_active(),
+            self._model.locs_3d is None,
+            self._saved_path,
+            self._var_autosave_dir_chb.get(),
+            self._update_thread_abort is not None and self._update_thread_abort.is_set(),
+            self._update_from_settings,
+            self._settings_dlg is not None,
+        )
+        if ui_state_key == self._ui_state_key:
+            return
+
         self._ui_update_start()
 
         if self.stage_is_active():
@@ -337,8 +409,9 @@ class FitFrame(ttk.Frame, IStage):
                     settings_dlg.enable(True)
             self._ui_start.configure(state=tk.NORMAL)
 
+            locs_3d = self._model.locs_3d
             # if self._model.stage_is_active(self._stage_type_next):
-            if self._model.locs_3d is not None:
+            if locs_3d is not None:
                 if self._var_autosave_dir_chb.get():
                     self._ui_save_as.configure(state=tk.DISABLED)
                 else:
@@ -347,9 +420,9 @@ class FitFrame(ttk.Frame, IStage):
                 self._ui_preview_hist.configure(state=tk.NORMAL)
                 self._ui_preview_3d.configure(state=tk.NORMAL)
 
-                points = self._model.locs_3d.shape[0]
-                frames = np.unique(self._model.locs_3d[:, 7]).shape[0]
-                views = int(np.sum(self._model.locs_3d[:, 5]))
+                if self._summary_stats is None:
+                    self._summary_stats = self._get_summary_stats(locs_3d)
+                points, frames, views = self._summary_stats
                 fit_msg = (
                     f'Fitting completed with {points} 3D localisations,'
                     f' used {frames} frames and {views} 2D localisations in total')
@@ -373,37 +446,72 @@ class FitFrame(ttk.Frame, IStage):
         self._ui_progress.configure(maximum=100)
         self._var_progress.set(100)
 
-    def _flash_start(self):
-        self._flash_stop()
-
-        def _toggle_on():
-            if self._flash_counter is None or self._flash_counter > 0:
-                self._var_start.set(1)
-                self._flash_id = self.after(500, _toggle_off)
+        self._ui_state_key = ui_state_key
 
-        def _toggle_off():
-            self._var_start.set(0)
-            if self._flash_counter is None or self._flash_counter > 0:
-                if self._flash_counter is not None:
-                    self._flash_counter -= 1
-                self._flash_id = self.after(500, _toggle_on)
+    def _resolve_frame_range(self) -> Tuple[int, int]:
+        fit_params = self._model.cfg.fit_params_full
+        lfl = self._model.lfl
+        frame_min = fit_params.frame_min if fit_params.frame_min > 0 else lfl.min_frame
+        frame_max = fit_params.frame_max if fit_params.frame_max > 0 else lfl.max_frame
+        return frame_min, frame_max
+
+    @staticmethod
+    def _get_keep_idx(locs_3d: npt.NDArray[float],
+                      max_lateral_err: Optional[float],
+                      min_view_count: Optional[int]) -> npt.NDArray[bool]:
+        # Whole-array ufuncs writing into one mask, all of them release the GIL
+        keep_idx = np.ones(locs_3d.shape[0], dtype=bool)
+        if max_lateral_err is not None:
+            # Fitting error in X and Y (in microns)
+            np.less(locs_3d[:, 3], max_lateral_err, out=keep_idx)
+        if min_view_count is not None:
+            # Number of views used to fit the localisation
+            keep_idx &= locs_3d[:, 5] > min_view_count
+        return keep_idx
+
+    @staticmethod
+    def _get_summary_stats(locs_3d: npt.NDArray[float]) -> Tuple[int, int, int]:
+        points = locs_3d.shape[0]
+        frames = smlfm.count_unique_frames(locs_3d[:, 7])
+        # View counts are small integers stored as floats, sum them as integers
+        views = int(np.add.reduce(locs_3d[:, 5].astype(np.int64)))
+        return points, frames, views
+
+    def _reset_kept_columns(self):
+        self._kept_xyz = None
+        self._kept_lateral_err = None
+        self._kept_axial_err = None
+        self._kept_photons = None
 
+    def _flash_start(self):
+        self._flash_stop()
         self._flash_counter = None
-        _toggle_on()
+        self._flash_tick()
 
     def _flash_stop(self):
         self._flash_counter = 0
         if self._flash_id is not None:
             self.after_cancel(self._flash_id)
+            self._flash_id = None
         self._var_start.set(0)
 
+    def _flash_tick(self):
+        self._flash_id = None
+        if self._flash_counter is not None and self._flash_counter <= 0:
+            self._var_start.set(0)
+            return
+        if self._var_start.get():
+            self._var_start.set(0)
+            if self._flash_counter is not None:
+                self._flash_counter -= 1
+        else:
+            self._var_start.set(1)
+        self._flash_id = self.after(500, self._flash_tick)
+
     def _on_autosave_dir(self):
+        self._ui_state_key = None
         if self._var_autosave_dir_chb.get():
-            dir_name = self._var_save_dir.get()
-            if dir_name:
-                self._model.cfg.save_dir = Path(dir_name)
-            else:
-                self._model.cfg.save_dir = None
+            self._set_save_dir(self._var_save_dir.get())
 
             self._ui_save_dir.configure(state=tk.NORMAL)
             self._ui_save_dir_btn.configure(state=tk.NORMAL)
@@ -411,6 +519,7 @@ class FitFrame(ttk.Frame, IStage):
                 self._ui_save_as.configure(state=tk.DISABLED)
         else:
             self._model.cfg.save_dir = None
+            self._last_save_dir_txt = None
 
             self._ui_save_dir.configure(state=tk.DISABLED)
             self._ui_save_dir_btn.configure(state=tk.DISABLED)
@@ -419,6 +528,11 @@ class FitFrame(ttk.Frame, IStage):
 
     def _on_save_dir_leave(self):
         dir_name = self._var_save_dir.get()
+        if dir_name != self._last_save_dir_txt:
+            self._set_save_dir(dir_name)
+
+    def _set_save_dir(self, dir_name: str):
+        self._last_save_dir_txt = dir_name
         self._model.cfg.save_dir = Path(dir_name) if dir_name else None
 
     def _on_get_save_dir(self):
@@ -432,7 +546,7 @@ class FitFrame(ttk.Frame, IStage):
             initialdir=initial_dir)
         if dir_name:
             self._var_save_dir.set(dir_name)
-            self._model.cfg.save_dir = Path(dir_name)
+            self._set_save_dir(dir_name)
 
     def _on_save_as(self):
         initial_dir = None
@@ -456,13 +570,14 @@ class FitFrame(ttk.Frame, IStage):
                 self._ui_update_done()
 
     def _on_settings(self):
-        cfg_dump_old = self._model.cfg.to_json()
+        # The dialog modifies only fitting parameters, compare them instead of whole JSON dumps
+        cfg_dump_old = dataclasses.astuple(self._model.cfg.fit_params_full)
 
         def _process_cb(apply: bool):
             self._settings_apply = apply
             self._update_from_settings = True
             nonlocal cfg_dump_old
-            cfg_dump_new = self._model.cfg.to_json()
+            cfg_dump_new = dataclasses.astuple(self._model.cfg.fit_params_full)
             if (cfg_dump_old != cfg_dump_new
                     # not self._model.stage_is_active(self._stage_type_next)
                     or self._model.locs_3d is None):
@@ -486,9 +601,10 @@ class FitFrame(ttk.Frame, IStage):
     def _on_start(self):
         self._var_start.set(0)
 
-        if self._update_thread is not None:
+        if self._update_running:
             if self._update_thread_abort is not None:
                 if not self._update_thread_abort.is_set():
+                    self._ui_state_key = None
                     self._ui_start.configure(state=tk.DISABLED)
                     self._var_summary.set('Aborting...')
                     self._update_thread_abort.set()
@@ -527,32 +643,45 @@ class FitFrame(ttk.Frame, IStage):
         if force_show_3d or force_update_3d:
             self._on_preview_3d(force_update_3d)
 
+    def _on_preview_wnd_map(self, graph_type: GraphType, mapped: bool, evt: tk.Event):
+        # The binding on toplevel window is triggered for all its child widgets too
+        if evt.widget is not self._model.graphs[graph_type]:
+            return
+
+        var_preview, on_preview = self._previews[graph_type]
+        if var_preview.get() != int(mapped):
+            var_preview.set(int(mapped))
+        if mapped:
+            on_preview()  # Redraw if updated while hidden
+
     def _on_preview_occ(self, force_update: bool = False):
 
         def draw(f: Figure, set_size: bool = True) -> Figure:
-            lateral_err = self._model.locs_3d[:, 3]  # Fitting error in X and Y (in microns)
-            axial_err = self._model.locs_3d[:, 4]  # Fitting error in Z (in microns)
-            photons = self._model.locs_3d[:, 6]  # Number of photons in fit
             return smlfm.graphs.draw_occurrences(
                 f,
-                lateral_err[self._keep_idx],
-                axial_err[self._keep_idx],
-                photons[self._keep_idx],
+                self._kept_lateral_err,
+                self._kept_axial_err,
+                self._kept_photons,
                 set_default_size=set_size)
 
         wnd = self._model.graphs[GraphType.OCCURRENCES]
         if wnd is None:
             fig = draw(Figure())
             wnd = FigureWindow(fig, master=self, title='Occurrences')
-            wnd.bind('<Map>', func=lambda _evt: self._var_preview_occ.set(1))
-            wnd.bind('<Unmap>', func=lambda _evt: self._var_preview_occ.set(0))
+            wnd.bind('<Map>',
+                     func=partial(self._on_preview_wnd_map, GraphType.OCCURRENCES, True))
+            wnd.bind('<Unmap>',
+                     func=partial(self._on_preview_wnd_map, GraphType.OCCURRENCES, False))
             self._model.graphs[GraphType.OCCURRENCES] = wnd
         else:
             if force_update:
-                draw(wnd.figure, set_size=False)
-                wnd.refresh()
+                self._dirty_graphs.add(GraphType.OCCURRENCES)
 
         if self._var_preview_occ.get():
+            if GraphType.OCCURRENCES in self._dirty_graphs:
+                self._dirty_graphs.discard(GraphType.OCCURRENCES)
+                draw(wnd.figure, set_size=False)
+                wnd.refresh()
             wnd.deiconify()
         else:
             wnd.withdraw()
@@ -560,27 +689,30 @@ class FitFrame(ttk.Frame, IStage):
     def _on_preview_hist(self, force_update: bool = False):
 
         def draw(f: Figure, set_size: bool = True) -> Figure:
-            axial_err = self._model.locs_3d[:, 4]  # Fitting error in Z (in microns)
-            photons = self._model.locs_3d[:, 6]  # Number of photons in fit
             return smlfm.graphs.draw_histogram(
                 f,
-                photons[self._keep_idx],
-                axial_err[self._keep_idx],
+                self._kept_photons,
+                self._kept_axial_err,
                 set_default_size=set_size)
 
         wnd = self._model.graphs[GraphType.HISTOGRAM]
         if wnd is None:
             fig = draw(Figure())
             wnd = FigureWindow(fig, master=self, title='Histogram')
-            wnd.bind('<Map>', func=lambda _evt: self._var_preview_hist.set(1))
-            wnd.bind('<Unmap>', func=lambda _evt: self._var_preview_hist.set(0))
+            wnd.bind('<Map>',
+                     func=partial(self._on_preview_wnd_map, GraphType.HISTOGRAM, True))
+            wnd.bind('<Unmap>',
+                     func=partial(self._on_preview_wnd_map, GraphType.HISTOGRAM, False))
             self._model.graphs[GraphType.HISTOGRAM] = wnd
         else:
             if force_update:
-                draw(wnd.figure, set_size=False)
-                wnd.refresh()
+                self._dirty_graphs.add(GraphType.HISTOGRAM)
 
         if self._var_preview_hist.get():
+            if GraphType.HISTOGRAM in self._dirty_graphs:
+                self._dirty_graphs.discard(GraphType.HISTOGRAM)
+                draw(wnd.figure, set_size=False)
+                wnd.refresh()
             wnd.deiconify()
         else:
             wnd.withdraw()
@@ -588,49 +720,45 @@ class FitFrame(ttk.Frame, IStage):
     def _on_preview_3d(self, force_update: bool = False):
 
         def draw(f: Figure, set_size: bool = True) -> Figure:
-            xyz = self._model.locs_3d[:, 0:3]  # X, Y, Z
             return smlfm.graphs.draw_3d_locs(
                 f,
-                xyz[self._keep_idx],
+                self._kept_xyz,
                 set_default_size=set_size)
 
         wnd = self._model.graphs[GraphType.LOCS_3D]
         if wnd is None:
             fig = draw(Figure())
             wnd = FigureWindow(fig, master=self, title='3D')
-            wnd.bind('<Map>', func=lambda _evt: self._var_preview_3d.set(1))
-            wnd.bind('<Unmap>', func=lambda _evt: self._var_preview_3d.set(0))
+            wnd.bind('<Map>',
+                     func=partial(self._on_preview_wnd_map, GraphType.LOCS_3D, True))
+            wnd.bind('<Unmap>',
+                     func=partial(self._on_preview_wnd_map, GraphType.LOCS_3D, False))
             self._model.graphs[GraphType.LOCS_3D] = wnd
         else:
             if force_update:
-                draw(wnd.figure, set_size=False)
-                wnd.refresh()
+                self._dirty_graphs.add(GraphType.LOCS_3D)
 
         if self._var_preview_3d.get():
+            if GraphType.LOCS_3D in self._dirty_graphs:
+                self._dirty_graphs.discard(GraphType.LOCS_3D)
+                draw(wnd.figure, set_size=False)
+                wnd.refresh()
             wnd.deiconify()
         else:
             wnd.withdraw()
 
     # Executed on thread
     def _update_task(self):
-        tic = time.time()
-
-        fit_params_all = dataclasses.replace(
-            self._model.cfg.fit_params_full,
-            frame_min=(self._model.cfg.fit_params_full.frame_min
-                       if self._model.cfg.fit_params_full.frame_min > 0
-                       else self._model.lfl.min_frame),
-            frame_max=(self._model.cfg.fit_params_full.frame_max
-                       if self._model.cfg.fit_params_full.frame_max > 0
-                       else self._model.lfl.max_frame),
-        )
+        tic = time.perf_counter()
+
+        fit_params_all = self._fit_params_all
 
         self._model.invoke_on_gui_thread_async(
             self._var_summary.set,
             f'Fitting frames'
             f' {fit_params_all.frame_min}-{fit_params_all.frame_max}...')
 
-        self._model.locs_3d, _ = smlfm.Fitting.light_field_fit(
+        locs_3d, _ = smlfm.Fitting.light_field_fit(
             self._model.lfl.corrected_locs_2d,
             self._model.lfm.rho_scaling, fit_params_all,
             abort_event=self._update_thread_abort,
@@ -639,43 +767,57 @@ class FitFrame(ttk.Frame, IStage):
                     self._var_progress.set, frame - min_frame + 1),
             progress_step=100,
             worker_count=self._model.cfg.max_workers)
+        # All further processing is column-wise, store the columns contiguously
+        locs_3d = np.asfortranarray(locs_3d)
+        self._model.locs_3d = locs_3d
 
         if self._update_thread_abort is not None:
             if self._update_thread_abort.is_set():
                 self._model.locs_3d = None
                 return
 
-        lateral_err = self._model.locs_3d[:, 3]  # Fitting error in X and Y (in microns)
-        view_count = self._model.locs_3d[:, 5]  # Number of views used to fit the localisation
-        max_lateral_err = self._model.cfg.show_max_lateral_err
-        min_view_count = self._model.cfg.show_min_view_count
-        self._keep_idx = np.logical_and(
-            (lateral_err < max_lateral_err) if max_lateral_err is not None else True,
-            (view_count > min_view_count) if min_view_count is not None else True)
+        self._keep_idx = self._get_keep_idx(
+            locs_3d,
+            self._model.cfg.show_max_lateral_err,
+            self._model.cfg.show_min_view_count)
+
+        # Filter the columns once here instead of on every preview redraw.
+        # Single precision is enough for plotting, `locs_3d` itself is kept intact for saving.
+        # The mask is converted to indices only once and reused for all columns.
+        keep_pos = np.flatnonzero(self._keep_idx)
+        self._kept_xyz = np.ascontiguousarray(
+            locs_3d[keep_pos, 0:3], dtype=np.float32)  # X, Y, Z
+        self._kept_lateral_err = locs_3d[keep_pos, 3].astype(np.float32)  # Error in X and Y
+        self._kept_axial_err = locs_3d[keep_pos, 4].astype(np.float32)  # Error in Z
+        self._kept_photons = locs_3d[keep_pos, 6].astype(np.float32)  # Photons in fit
+
+        self._summary_stats = self._get_summary_stats(locs_3d)
 
         if self._model.cfg.log_timing:
-            print(f'Complete fitting took {1e3 * (time.time() - tic):.3f} ms')
+            print(f'Complete fitting took {1e3 * (time.perf_counter() - tic):.3f} ms')
 
         if self._update_thread_abort is not None:
             if self._update_thread_abort.is_set():
                 self._model.locs_3d = None
                 self._keep_idx = None
+                self._reset_kept_columns()
+                self._summary_stats = None
                 return
 
         if self._model.cfg.save_dir is not None:
-            timestamp_str = self._model.save_timestamp.strftime('%Y%m%d-%H%M%S')
-            sub_dir = Path(f'3D Fitting - {timestamp_str}'
-                           f' - {self._model.cfg.csv_file.name}')
-            self._saved_path = self.save(sub_dir)
+            self._saved_path = self.save(self._planned_sub_dir)
 
     # Executed on both, main thread and update thread
     def save(self, folder: Path) -> Path:
         results = smlfm.OutputFiles(self._model.cfg, folder)
 
+        # Both files must be written from the same data, even if replaced meanwhile
+        locs_3d = self._model.locs_3d
+
         results.mkdir()
         results.save_config()
-        results.save_csv(self._model.locs_3d)
-        results.save_visp(self._model.locs_3d)
+        results.save_csv(locs_3d)
+        results.save_visp(locs_3d)
         results.save_figures()
 
         return results.folder
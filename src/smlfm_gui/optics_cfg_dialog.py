@@ -1,15 +1,47 @@
 import tkinter as tk
-from idlelib.tooltip import Hovertip
 from tkinter import ttk
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import smlfm
 from .app_model import AppModel
 from .cfg_dialog import CfgDialog
 from .consts import READONLY
+from .shared_tooltip import SharedTooltip
+
+# Rows with numeric settings in tuples (name, label, unit, value count).
+# Settings with two values are tuples in the configuration.
+_FIELDS: Tuple[Tuple[str, str, Optional[str], int], ...] = (
+    ('mla_lens_pitch', 'MLA lens pitch:', '\u00B5m', 1),  # microns
+    ('mla_optic_size', 'MLA optic size:', '\u00B5m', 1),  # microns
+    ('mla_centre', 'MLA centre:', '[lsu]', 2),
+    ('mla_rotation', 'MLA rotation:', 'deg', 1),
+    ('mla_offset', 'MLA offset:', '\u00B5m', 2),  # microns
+    ('focal_length_mla', 'MLA focal length:', 'mm', 1),
+    ('focal_length_obj_lens', 'Objective lens focal length:', 'mm', 1),
+    ('focal_length_fourier_lens', 'Fourier lens focal length:', 'mm', 1),
+    ('focal_length_tube_lens', 'Tube lens focal length:', 'mm', 1),
+    ('num_aperture', 'Objective num. aperture:', None, 1),
+    ('ref_idx_immersion', 'Immersion refractive index:', None, 1),
+    ('ref_idx_medium', 'Medium refractive index:', None, 1),
+    ('pixel_size_camera', 'Camera pixel size:', '\u00B5m', 1),  # microns
+)
+
+# Names of all configuration settings edited by the dialog
+SETTING_NAMES: Tuple[str, ...] = ('mla_type',) + tuple(field[0] for field in _FIELDS)
+
+# Tooltip texts of the settings, resolved once at import
+_DOC_STRINGS = {name: getattr(smlfm.Config, f'_{name}_doc') for name in SETTING_NAMES}
+
+# Styles of the entries with valid and invalid values
+_ENTRY_STYLE = 'Optics.TEntry'
+_ERROR_ENTRY_STYLE = 'Error.Optics.TEntry'
+
+# Tooltip texts of the units that are not obvious
+_UNIT_DOC_STRINGS = {
+    '[lsu]': 'lattice spacing units',
+}
 
 
-# pylint: disable=too-many-instance-attributes
 class OpticsCfgDialog(CfgDialog):
 
     def __init__(self, parent, model: AppModel, title: Optional[str] = None,
@@ -17,393 +49,152 @@ class OpticsCfgDialog(CfgDialog):
         if title is None:
             title = 'Optics Settings'
 
-        self._ui_mla_type: Optional[ttk.Combobox] = None
-        self._var_mla_type = tk.StringVar(value=model.cfg.mla_type.name)
-
-        self._ui_mla_lens_pitch: Optional[ttk.Entry] = None
-        self._var_mla_lens_pitch = tk.StringVar(value=str(model.cfg.mla_lens_pitch))
-        self._ui_mla_lens_pitch_tip: Optional[Hovertip] = None
-
-        self._ui_mla_optic_size: Optional[ttk.Entry] = None
-        self._var_mla_optic_size = tk.StringVar(value=str(model.cfg.mla_optic_size))
-        self._ui_mla_optic_size_tip: Optional[Hovertip] = None
-
-        self._ui_mla_centre_x: Optional[ttk.Entry] = None
-        self._var_mla_centre_x = tk.StringVar(value=str(model.cfg.mla_centre[0]))
-        self._ui_mla_centre_x_tip: Optional[Hovertip] = None
-        self._ui_mla_centre_y: Optional[ttk.Entry] = None
-        self._var_mla_centre_y = tk.StringVar(value=str(model.cfg.mla_centre[1]))
-        self._ui_mla_centre_y_tip: Optional[Hovertip] = None
-
-        self._ui_mla_rotation: Optional[ttk.Entry] = None
-        self._var_mla_rotation = tk.StringVar(value=str(model.cfg.mla_rotation))
-        self._ui_mla_rotation_tip: Optional[Hovertip] = None
-
-        self._ui_mla_offset_x: Optional[ttk.Entry] = None
-        self._var_mla_offset_x = tk.StringVar(value=str(model.cfg.mla_offset[0]))
-        self._ui_mla_offset_x_tip: Optional[Hovertip] = None
-        self._ui_mla_offset_y: Optional[ttk.Entry] = None
-        self._var_mla_offset_y = tk.StringVar(value=str(model.cfg.mla_offset[1]))
-        self._ui_mla_offset_y_tip: Optional[Hovertip] = None
-
-        self._ui_focal_length_mla: Optional[ttk.Entry] = None
-        self._var_focal_length_mla = tk.StringVar(
-            value=str(model.cfg.focal_length_mla))
-        self._ui_focal_length_mla_tip: Optional[Hovertip] = None
-
-        self._ui_focal_length_obj_lens: Optional[ttk.Entry] = None
-        self._var_focal_length_obj_lens = tk.StringVar(
-            value=str(model.cfg.focal_length_obj_lens))
-        self._ui_focal_length_obj_lens_tip: Optional[Hovertip] = None
-
-        self._ui_focal_length_fourier_lens: Optional[ttk.Entry] = None
-        self._var_focal_length_fourier_lens = tk.StringVar(
-            value=str(model.cfg.focal_length_fourier_lens))
-        self._ui_focal_length_fourier_lens_tip: Optional[Hovertip] = None
-
-        self._ui_focal_length_tube_lens: Optional[ttk.Entry] = None
-        self._var_focal_length_tube_lens = tk.StringVar(
-            value=str(model.cfg.focal_length_tube_lens))
-        self._ui_focal_length_tube_lens_tip: Optional[Hovertip] = None
-
-        self._ui_num_aperture: Optional[ttk.Entry] = None
-        self._var_num_aperture = tk.StringVar(value=str(model.cfg.num_aperture))
-        self._ui_num_aperture_tip: Optional[Hovertip] = None
-
-        self._ui_ref_idx_immersion: Optional[ttk.Entry] = None
-        self._var_ref_idx_immersion = tk.StringVar(
-            value=str(model.cfg.ref_idx_immersion))
-        self._ui_ref_idx_immersion_tip: Optional[Hovertip] = None
-
-        self._ui_ref_idx_medium: Optional[ttk.Entry] = None
-        self._var_ref_idx_medium = tk.StringVar(value=str(model.cfg.ref_idx_medium))
-        self._ui_ref_idx_medium_tip: Optional[Hovertip] = None
-
-        self._ui_pixel_size_camera: Optional[ttk.Entry] = None
-        self._var_pixel_size_camera = tk.StringVar(
-            value=str(model.cfg.pixel_size_camera))
-        self._ui_pixel_size_camera_tip: Optional[Hovertip] = None
+        # Input widgets and their variables keyed by setting name, one per value
+        self._ui: Dict[str, List[Union[ttk.Combobox, ttk.Entry]]] = {}
+        self._var: Dict[str, List[tk.StringVar]] = {}
+        # An entry highlighted by last failed validation
+        self._error_entry: Optional[ttk.Entry] = None
+        # Values of numeric settings parsed by last successful validation
+        self._parsed: Dict[str, Union[float, Tuple[float, ...]]] = {}
+
+        self._tip: Optional[SharedTooltip] = None
+        # Key validation command shared by all entries, registered in Tcl once
+        self._vcmd: Optional[Tuple[str, str]] = None
+        self._ui_tab: Optional[ttk.Frame] = None
+        # Grid commands of the rows being created, evaluated together
+        self._grid_cmds: List[str] = []
 
         super().__init__(parent, model, title, process_cb=process_cb)
 
-    # noinspection PyProtectedMember
-    # pylint: disable=protected-access,too-many-statements
     def body(self, master) -> tk.BaseWidget:
-        ui_tab = ttk.Frame(master)
-        row = 0
-
+        # Variables belong to this dialog, not to the application window
+        self._var['mla_type'] = [
+            tk.StringVar(master=self, value=self.model.cfg.mla_type.name)]
+        for name, _label, _unit, count in _FIELDS:
+            self._var[name] = [
+                tk.StringVar(master=self, value=text)
+                for text in _to_strings(getattr(self.model.cfg, name), count)]
+
+        self._tip = SharedTooltip(self)
+        # All entries share one named style, ttk resolves it to TEntry by name,
+        # only the error style derived from it needs own settings
+        ttk.Style(self).configure(_ERROR_ENTRY_STYLE, fieldbackground='#ffc0c0')
+        self._vcmd = (self.register(_is_float_prefix), '%P')
+        self._ui_tab = ttk.Frame(master)
+
+        self._add_mla_type_row(self._ui_tab, 0)
+        for row, field in enumerate(_FIELDS, start=1):
+            self._add_field_row(field, self._ui_tab, row)
+        self._grid_cmds.append(f'grid columnconfigure {self._ui_tab} 1 -weight 1')
+        self._grid_cmds.append(f'grid columnconfigure {self._ui_tab} 2 -weight 1')
+        # Lay out all rows in one Tcl call
+        self.tk.eval('\n'.join(self._grid_cmds))
+        self._grid_cmds = []
+
+        self._ui_tab.pack(anchor=tk.NW, fill=tk.X, expand=True, padx=5, pady=5)
+
+        return self._ui['mla_type'][0]  # Control that gets initial focus
+
+    def destroy(self):
+        """Destroy the window."""
+        self._parsed = {}
+        if self._tip is not None:
+            self._tip.destroy()
+            self._tip = None
+        super().destroy()
+
+    def _grid(self, widget: tk.Widget, column: int, row: int, sticky: str,
+              columnspan: int = 1) -> None:
+        """Queue a grid command for the widget, with final padding included."""
+        self._grid_cmds.append(
+            f'grid configure {widget} -column {column} -row {row} -sticky {sticky}'
+            f' -columnspan {columnspan} -padx 1 -pady 1')
+
+    def _add_mla_type_row(self, ui_tab: ttk.Frame, row: int) -> None:
         ui_mla_type_lbl = ttk.Label(ui_tab, text='MLA lattice type:', anchor=tk.E)
-        Hovertip(ui_mla_type_lbl, text=self.model.cfg._mla_type_doc)
-        self._ui_mla_type = ttk.Combobox(
+        ui_mla_type = ttk.Combobox(
             ui_tab, state=READONLY,
             values=[t.name for t in smlfm.MicroLensArray.LatticeType],
-            textvariable=self._var_mla_type)
-        Hovertip(self._ui_mla_type, text=self.model.cfg._mla_type_doc)
-        self.ui_widgets.append(self._ui_mla_type)
-        #
-        ui_mla_type_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_mla_type.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        row += 1
-
-        ui_mla_lens_pitch_lbl = ttk.Label(ui_tab, text='MLA lens pitch:', anchor=tk.E)
-        Hovertip(ui_mla_lens_pitch_lbl, text=self.model.cfg._mla_lens_pitch_doc)
-        self._ui_mla_lens_pitch = ttk.Entry(
-            ui_tab, textvariable=self._var_mla_lens_pitch)
-        self._ui_mla_lens_pitch_tip = Hovertip(
-            self._ui_mla_lens_pitch, text=self.model.cfg._mla_lens_pitch_doc)
-        self.ui_widgets.append(self._ui_mla_lens_pitch)
-        ui_mla_lens_pitch_unit = ttk.Label(ui_tab, text='\u00B5m')  # microns
-        #
-        ui_mla_lens_pitch_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_mla_lens_pitch.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        ui_mla_lens_pitch_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_mla_optic_size_lbl = ttk.Label(ui_tab, text='MLA optic size:', anchor=tk.E)
-        Hovertip(ui_mla_optic_size_lbl, text=self.model.cfg._mla_optic_size_doc)
-        self._ui_mla_optic_size = ttk.Entry(
-            ui_tab, textvariable=self._var_mla_optic_size)
-        self._ui_mla_optic_size_tip = Hovertip(
-            self._ui_mla_optic_size, text=self.model.cfg._mla_optic_size_doc)
-        self.ui_widgets.append(self._ui_mla_optic_size)
-        ui_mla_optic_size_unit = ttk.Label(ui_tab, text='\u00B5m')  # microns
-        #
-        ui_mla_optic_size_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_mla_optic_size.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        ui_mla_optic_size_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_mla_centre_lbl = ttk.Label(ui_tab, text='MLA centre:', anchor=tk.E)
-        Hovertip(ui_mla_centre_lbl, text=self.model.cfg._mla_centre_doc)
-        self._ui_mla_centre_x = ttk.Entry(
-            ui_tab, textvariable=self._var_mla_centre_x)
-        self._ui_mla_centre_x_tip = Hovertip(
-            self._ui_mla_centre_x, text=self.model.cfg._mla_centre_doc)
-        self.ui_widgets.append(self._ui_mla_centre_x)
-        self._ui_mla_centre_y = ttk.Entry(
-            ui_tab, textvariable=self._var_mla_centre_y)
-        self._ui_mla_centre_y_tip = Hovertip(
-            self._ui_mla_centre_y, text=self.model.cfg._mla_centre_doc)
-        self.ui_widgets.append(self._ui_mla_centre_y)
-        ui_mla_centre_unit = ttk.Label(ui_tab, text='[lsu]')
-        Hovertip(ui_mla_centre_unit, text='lattice spacing units')
-        #
-        ui_mla_centre_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_mla_centre_x.grid(column=1, row=row, sticky=tk.EW)
-        self._ui_mla_centre_y.grid(column=2, row=row, sticky=tk.EW)
-        ui_mla_centre_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_mla_rotation_lbl = ttk.Label(ui_tab, text='MLA rotation:', anchor=tk.E)
-        Hovertip(ui_mla_rotation_lbl, text=self.model.cfg._mla_rotation_doc)
-        self._ui_mla_rotation = ttk.Entry(
-            ui_tab, textvariable=self._var_mla_rotation)
-        self._ui_mla_rotation_tip = Hovertip(
-            self._ui_mla_rotation, text=self.model.cfg._mla_rotation_doc)
-        self.ui_widgets.append(self._ui_mla_rotation)
-        ui_mla_rotation_unit = ttk.Label(ui_tab, text='deg')
-        #
-        ui_mla_rotation_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_mla_rotation.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        ui_mla_rotation_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_mla_offset_lbl = ttk.Label(ui_tab, text='MLA offset:', anchor=tk.E)
-        Hovertip(ui_mla_offset_lbl, text=self.model.cfg._mla_offset_doc)
-        self._ui_mla_offset_x = ttk.Entry(
-            ui_tab, textvariable=self._var_mla_offset_x)
-        self._ui_mla_offset_x_tip = Hovertip(
-            self._ui_mla_offset_x, text=self.model.cfg._mla_offset_doc)
-        self.ui_widgets.append(self._ui_mla_offset_x)
-        self._ui_mla_offset_y = ttk.Entry(
-            ui_tab, textvariable=self._var_mla_offset_y)
-        self._ui_mla_offset_y_tip = Hovertip(
-            self._ui_mla_offset_y, text=self.model.cfg._mla_offset_doc)
-        self.ui_widgets.append(self._ui_mla_offset_y)
-        ui_mla_offset_unit = ttk.Label(ui_tab, text='\u00B5m')  # microns
-        #
-        ui_mla_offset_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_mla_offset_x.grid(column=1, row=row, sticky=tk.EW)
-        self._ui_mla_offset_y.grid(column=2, row=row, sticky=tk.EW)
-        ui_mla_offset_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_focal_length_mla_lbl = ttk.Label(
-            ui_tab, text='MLA focal length:', anchor=tk.E)
-        Hovertip(ui_focal_length_mla_lbl, text=self.model.cfg._focal_length_mla_doc)
-        self._ui_focal_length_mla = ttk.Entry(
-            ui_tab, textvariable=self._var_focal_length_mla)
-        self._ui_focal_length_mla_tip = Hovertip(
-            self._ui_focal_length_mla, text=self.model.cfg._focal_length_mla_doc)
-        self.ui_widgets.append(self._ui_focal_length_mla)
-        ui_focal_length_mla_unit = ttk.Label(ui_tab, text='mm')
-        #
-        ui_focal_length_mla_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_focal_length_mla.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        ui_focal_length_mla_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_focal_length_obj_lens_lbl = ttk.Label(
-            ui_tab, text='Objective lens focal length:', anchor=tk.E)
-        Hovertip(ui_focal_length_obj_lens_lbl,
-                 text=self.model.cfg._focal_length_obj_lens_doc)
-        self._ui_focal_length_obj_lens = ttk.Entry(
-            ui_tab, textvariable=self._var_focal_length_obj_lens)
-        self._ui_focal_length_obj_lens_tip = Hovertip(
-            self._ui_focal_length_obj_lens,
-            text=self.model.cfg._focal_length_obj_lens_doc)
-        self.ui_widgets.append(self._ui_focal_length_obj_lens)
-        ui_focal_length_obj_lens_unit = ttk.Label(ui_tab, text='mm')
-        #
-        ui_focal_length_obj_lens_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_focal_length_obj_lens.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        ui_focal_length_obj_lens_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_focal_length_fourier_lens_lbl = ttk.Label(
-            ui_tab, text='Fourier lens focal length:', anchor=tk.E)
-        Hovertip(ui_focal_length_fourier_lens_lbl,
-                 text=self.model.cfg._focal_length_fourier_lens_doc)
-        self._ui_focal_length_fourier_lens = ttk.Entry(
-            ui_tab, textvariable=self._var_focal_length_fourier_lens)
-        self._ui_focal_length_fourier_lens_tip = Hovertip(
-            self._ui_focal_length_fourier_lens,
-            text=self.model.cfg._focal_length_fourier_lens_doc)
-        self.ui_widgets.append(self._ui_focal_length_fourier_lens)
-        ui_focal_length_fourier_lens_unit = ttk.Label(ui_tab, text='mm')
-        #
-        ui_focal_length_fourier_lens_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_focal_length_fourier_lens.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        ui_focal_length_fourier_lens_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_focal_length_tube_lens_lbl = ttk.Label(
-            ui_tab, text='Tube lens focal length:', anchor=tk.E)
-        Hovertip(ui_focal_length_tube_lens_lbl,
-                 text=self.model.cfg._focal_length_tube_lens_doc)
-        self._ui_focal_length_tube_lens = ttk.Entry(
-            ui_tab, textvariable=self._var_focal_length_tube_lens)
-        self._ui_focal_length_tube_lens_tip = Hovertip(
-            self._ui_focal_length_tube_lens,
-            text=self.model.cfg._focal_length_tube_lens_doc)
-        self.ui_widgets.append(self._ui_focal_length_tube_lens)
-        ui_focal_length_tube_lens_unit = ttk.Label(ui_tab, text='mm')
-        #
-        ui_focal_length_tube_lens_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_focal_length_tube_lens.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        ui_focal_length_tube_lens_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        ui_num_aperture_lbl = ttk.Label(
-            ui_tab, text='Objective num. aperture:', anchor=tk.E)
-        Hovertip(ui_num_aperture_lbl, text=self.model.cfg._num_aperture_doc)
-        self._ui_num_aperture = ttk.Entry(
-            ui_tab, textvariable=self._var_num_aperture)
-        self._ui_num_aperture_tip = Hovertip(
-            self._ui_num_aperture, text=self.model.cfg._num_aperture_doc)
-        self.ui_widgets.append(self._ui_num_aperture)
-        #
-        ui_num_aperture_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_num_aperture.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        row += 1
-
-        ui_ref_idx_immersion_lbl = ttk.Label(
-            ui_tab, text='Immersion refractive index:', anchor=tk.E)
-        Hovertip(ui_ref_idx_immersion_lbl, text=self.model.cfg._ref_idx_immersion_doc)
-        self._ui_ref_idx_immersion = ttk.Entry(
-            ui_tab, textvariable=self._var_ref_idx_immersion)
-        self._ui_ref_idx_immersion_tip = Hovertip(
-            self._ui_ref_idx_immersion, text=self.model.cfg._ref_idx_immersion_doc)
-        self.ui_widgets.append(self._ui_ref_idx_immersion)
+            textvariable=self._var['mla_type'][0])
+        self._tip.register(ui_mla_type, _DOC_STRINGS['mla_type'])
+        self.ui_widgets.append(ui_mla_type)
+        self._ui['mla_type'] = [ui_mla_type]
         #
-        ui_ref_idx_immersion_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_ref_idx_immersion.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        row += 1
-
-        ui_ref_idx_medium_lbl = ttk.Label(
-            ui_tab, text='Medium refractive index:', anchor=tk.E)
-        Hovertip(ui_ref_idx_medium_lbl, text=self.model.cfg._ref_idx_medium_doc)
-        self._ui_ref_idx_medium = ttk.Entry(
-            ui_tab, textvariable=self._var_ref_idx_medium)
-        self._ui_ref_idx_medium_tip = Hovertip(
-            self._ui_ref_idx_medium, text=self.model.cfg._ref_idx_medium_doc)
-        self.ui_widgets.append(self._ui_ref_idx_medium)
-        #
-        ui_ref_idx_medium_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_ref_idx_medium.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        row += 1
-
-        ui_pixel_size_camera_lbl = ttk.Label(
-            ui_tab, text='Camera pixel size:', anchor=tk.E)
-        Hovertip(ui_pixel_size_camera_lbl, text=self.model.cfg._pixel_size_camera_doc)
-        self._ui_pixel_size_camera = ttk.Entry(
-            ui_tab, textvariable=self._var_pixel_size_camera)
-        self._ui_pixel_size_camera_tip = Hovertip(
-            self._ui_pixel_size_camera, text=self.model.cfg._pixel_size_camera_doc)
-        self.ui_widgets.append(self._ui_pixel_size_camera)
-        ui_pixel_size_camera_unit = ttk.Label(ui_tab, text='\u00B5m')  # microns
-        #
-        ui_pixel_size_camera_lbl.grid(column=0, row=row, sticky=tk.W)
-        self._ui_pixel_size_camera.grid(column=1, row=row, sticky=tk.EW, columnspan=2)
-        ui_pixel_size_camera_unit.grid(column=3, row=row, sticky=tk.W)
-        row += 1
-
-        # Final padding and layout
-        ui_tab.columnconfigure(index=1, weight=1)
-        ui_tab.columnconfigure(index=2, weight=1)
-        self.model.grid_slaves_configure(ui_tab, padx=1, pady=1)
+        self._grid(ui_mla_type_lbl, column=0, row=row, sticky=tk.W)
+        self._grid(ui_mla_type, column=1, row=row, sticky=tk.EW, columnspan=2)
+
+    def _add_field_row(self, field: Tuple[str, str, Optional[str], int],
+                       ui_tab: ttk.Frame, row: int) -> None:
+        name, label, unit, count = field
+        doc = _DOC_STRINGS[name]
+
+        ui_lbl = ttk.Label(ui_tab, text=label, anchor=tk.E)
+        self._grid(ui_lbl, column=0, row=row, sticky=tk.W)
+
+        entries = []
+        for idx, var in enumerate(self._var[name]):
+            ui_entry = ttk.Entry(ui_tab, textvariable=var, style=_ENTRY_STYLE,
+                                 validate='key', validatecommand=self._vcmd)
+            self._tip.register(ui_entry, doc)
+            self.ui_widgets.append(ui_entry)
+            if count > 1:
+                self._grid(ui_entry, column=1 + idx, row=row, sticky=tk.EW)
+            else:
+                self._grid(ui_entry, column=1, row=row, sticky=tk.EW, columnspan=2)
+            entries.append(ui_entry)
+        self._ui[name] = entries
+
+        if unit is not None:
+            ui_unit = ttk.Label(ui_tab, text=unit)
+            if unit in _UNIT_DOC_STRINGS:
+                self._tip.register(ui_unit, _UNIT_DOC_STRINGS[unit])
+            self._grid(ui_unit, column=3, row=row, sticky=tk.W)
 
-        ui_tab.pack(anchor=tk.NW, fill=tk.X, expand=True, padx=5, pady=5)
-
-        return self._ui_mla_type  # Control that gets initial focus
-
-    # pylint: disable=too-many-return-statements,too-many-branches
     def validate(self) -> bool:
-        if not self.is_float(self._var_mla_lens_pitch.get()):
-            self.initial_focus = self._ui_mla_lens_pitch
-            self._ui_mla_lens_pitch_tip.showtip()
-            return False
-        if not self.is_float(self._var_mla_optic_size.get()):
-            self.initial_focus = self._ui_mla_optic_size
-            self._ui_mla_optic_size_tip.showtip()
-            return False
-        if not self.is_float(self._var_mla_centre_x.get()):
-            self.initial_focus = self._ui_mla_centre_x
-            self._ui_mla_centre_x_tip.showtip()
-            return False
-        if not self.is_float(self._var_mla_centre_y.get()):
-            self.initial_focus = self._ui_mla_centre_y
-            self._ui_mla_centre_y_tip.showtip()
-            return False
-        if not self.is_float(self._var_mla_rotation.get()):
-            self.initial_focus = self._ui_mla_rotation
-            self._ui_mla_rotation_tip.showtip()
-            return False
-        if not self.is_float(self._var_mla_offset_x.get()):
-            self.initial_focus = self._ui_mla_offset_x
-            self._ui_mla_offset_x_tip.showtip()
-            return False
-        if not self.is_float(self._var_mla_offset_y.get()):
-            self.initial_focus = self._ui_mla_offset_y
-            self._ui_mla_offset_y_tip.showtip()
-            return False
-        if not self.is_float(self._var_focal_length_mla.get()):
-            self.initial_focus = self._ui_focal_length_mla
-            self._ui_focal_length_mla_tip.showtip()
-            return False
-        if not self.is_float(self._var_focal_length_obj_lens.get()):
-            self.initial_focus = self._ui_focal_length_obj_lens
-            self._ui_focal_length_obj_lens_tip.showtip()
-            return False
-        if not self.is_float(self._var_focal_length_fourier_lens.get()):
-            self.initial_focus = self._ui_focal_length_fourier_lens
-            self._ui_focal_length_fourier_lens_tip.showtip()
-            return False
-        if not self.is_float(self._var_focal_length_tube_lens.get()):
-            self.initial_focus = self._ui_focal_length_tube_lens
-            self._ui_focal_length_tube_lens_tip.showtip()
-            return False
-        if not self.is_float(self._var_num_aperture.get()):
-            self.initial_focus = self._ui_num_aperture
-            self._ui_num_aperture_tip.showtip()
-            return False
-        if not self.is_float(self._var_ref_idx_immersion.get()):
-            self.initial_focus = self._ui_ref_idx_immersion
-            self._ui_ref_idx_immersion_tip.showtip()
-            return False
-        if not self.is_float(self._var_ref_idx_medium.get()):
-            self.initial_focus = self._ui_ref_idx_medium
-            self._ui_ref_idx_medium_tip.showtip()
-            return False
-        if not self.is_float(self._var_pixel_size_camera.get()):
-            self.initial_focus = self._ui_pixel_size_camera
-            self._ui_pixel_size_camera_tip.showtip()
-            return False
+        self._parsed = {}
+        for name, *_ in _FIELDS:
+            values = []
+            for var, ui_entry in zip(self._var[name], self._ui[name]):
+                try:
+                    values.append(float(var.get()))
+                except ValueError:
+                    self._parsed = {}
+                    self._set_error_entry(ui_entry)
+                    self.initial_focus = ui_entry
+                    self._tip.show_for(ui_entry)
+                    return False
+            self._parsed[name] = tuple(values) if len(values) > 1 else values[0]
+        self._set_error_entry(None)
 
         return super().validate()
 
+    def _set_error_entry(self, ui_entry: Optional[ttk.Entry]) -> None:
+        """Highlight the entry with invalid value, only one at a time."""
+        if self._error_entry is not None:
+            self._error_entry.configure(style=_ENTRY_STYLE)
+        self._error_entry = ui_entry
+        if ui_entry is not None:
+            ui_entry.configure(style=_ERROR_ENTRY_STYLE)
+
     def process(self) -> None:
         self.model.cfg.mla_type = smlfm.MicroLensArray.LatticeType[
-            self._var_mla_type.get()]
-        self.model.cfg.mla_lens_pitch = float(self._var_mla_lens_pitch.get())
-        self.model.cfg.mla_optic_size = float(self._var_mla_optic_size.get())
-        self.model.cfg.mla_centre = (  # Tuple
-            float(self._var_mla_centre_x.get()),
-            float(self._var_mla_centre_y.get()))
-        self.model.cfg.mla_rotation = float(self._var_mla_rotation.get())
-        self.model.cfg.mla_offset = (  # Tuple
-            float(self._var_mla_offset_x.get()),
-            float(self._var_mla_offset_y.get()))
-        self.model.cfg.focal_length_mla = float(self._var_focal_length_mla.get())
-        self.model.cfg.focal_length_obj_lens = (
-            float(self._var_focal_length_obj_lens.get()))
-        self.model.cfg.focal_length_fourier_lens = (
-            float(self._var_focal_length_fourier_lens.get()))
-        self.model.cfg.focal_length_tube_lens = (
-            float(self._var_focal_length_tube_lens.get()))
-        self.model.cfg.num_aperture = float(self._var_num_aperture.get())
-        self.model.cfg.ref_idx_immersion = float(self._var_ref_idx_immersion.get())
-        self.model.cfg.ref_idx_medium = float(self._var_ref_idx_medium.get())
-        self.model.cfg.pixel_size_camera = float(self._var_pixel_size_camera.get())
+            self._var['mla_type'][0].get()]
+        # Values parsed by `validate()` that is always called right before
+        for name, value in self._parsed.items():
+            setattr(self.model.cfg, name, value)
 
         super().process()
+
+
+def _to_strings(value: Union[float, Tuple[float, ...]], count: int) -> List[str]:
+    """Convert a setting value with given value count to entry texts."""
+    return [str(v) for v in value] if count > 1 else [str(value)]
+
+
+def _is_float_prefix(text: str) -> bool:
+    """Check the text is a float number or can become one while typing.
+
+    Incomplete values like empty text, '-', '.' or '1e-' are accepted too,
+    these are rejected only by final validation on submit.
+    """
+    return CfgDialog.is_float(text + '0')
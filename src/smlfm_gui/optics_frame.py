@@ -1,10 +1,10 @@
 import time
 import tkinter as tk
 import traceback as tb
+from functools import partial
 from idlelib.tooltip import Hovertip
-from threading import Thread
 from tkinter import messagebox, ttk
-from typing import Optional
+from typing import Optional, Set
 
 import numpy as np
 from matplotlib.figure import Figure
@@ -15,10 +15,10 @@ import smlfm.graphs
 from .app_model import AppModel, IStage
 from .consts import COMMAND, IMAGE, TEXTVARIABLE, VARIABLE, GraphType, StageType
 from .figure_window import FigureWindow
-from .optics_cfg_dialog import OpticsCfgDialog
+from .optics_cfg_dialog import SETTING_NAMES, OpticsCfgDialog
 
 
-# pylint: disable=too-many-ancestors
+# pylint: disable=too-many-ancestors,too-many-instance-attributes
 class OpticsFrame(ttk.Frame, IStage):
 
     def __init__(self, master, model: AppModel, *args, **kwargs):
@@ -28,6 +28,8 @@ class OpticsFrame(ttk.Frame, IStage):
         self._stage_type_next = StageType.FILTER
 
         self._model = model
+        # The application window, its cursor indicates running update
+        self._toplevel = self.winfo_toplevel()
 
         # Controls
         self._ui_frm_lbl = ttk.Label(self)
@@ -97,8 +99,24 @@ class OpticsFrame(ttk.Frame, IStage):
         self._var_preview = tk.IntVar()
         self._ui_preview[VARIABLE] = self._var_preview
 
-        self._update_thread: Optional[Thread] = None
+        # Preview check button variables and show/hide handlers per graph type
+        self._previews = {
+            GraphType.MLA: (self._var_preview_mla, self._on_preview_mla),
+            GraphType.MAPPED: (self._var_preview, self._on_preview),
+        }
+
+        # True while the update task runs on worker thread
+        self._update_running: bool = False
+        # True if another update was requested while one was running
+        self._update_pending: bool = False
         self._update_thread_err: Optional[str] = None
+        # A number of lenses with any localisation, counted once after mapping
+        self._lens_count: Optional[int] = None
+        # BFP radius in X,Y units for the mapping preview, computed once per
+        # optics configuration together with `AppModel.xy_lens_centres`
+        self._xy_bfp_radius: Optional[float] = None
+        # Graphs with outdated content, redrawn once their window is shown
+        self._dirty_graphs: Set[GraphType] = set()
 
         self._settings_dlg: Optional[OpticsCfgDialog] = None
         self._settings_apply: bool = False
@@ -123,11 +141,17 @@ class OpticsFrame(ttk.Frame, IStage):
     def stage_invalidate(self):
         self._model.lfm = None
         self._model.mla = None
+        self._model.xy_lens_centres = None
         self._model.lfl = None
+        self._lens_count = None
+        self._xy_bfp_radius = None
+        self._dirty_graphs.clear()
 
         if not self._update_from_settings:
+            # The windows are reused, the hidden ones are redrawn once shown again
             for gt in [GraphType.MLA, GraphType.MAPPED]:
-                self._model.destroy_graph(gt)
+                if self._model.hide_graph(gt):
+                    self._dirty_graphs.add(gt)
 
         self._model.stage_enabled(self._stage_type, False)
 
@@ -135,9 +159,16 @@ class OpticsFrame(ttk.Frame, IStage):
         self._model.stage_invalidate(self._stage_type_next)
 
     def stage_start_update(self):
+        if self._update_running:
+            # Coalesce all requests into one update started when this one ends
+            self._update_pending = True
+            return
+
         self.stage_invalidate()
         self._model.stages_ui_updating(True)
-        self.winfo_toplevel().configure(cursor='watch')
+        self._toplevel.configure(cursor='watch')
+        # Set here on GUI thread, the task reports only the next step
+        self._var_summary.set('Configuring optics...')
 
         def _update_thread_fn():
             try:
@@ -147,8 +178,15 @@ class OpticsFrame(ttk.Frame, IStage):
                 tb.print_exception(None, ex, ex.__traceback__)
 
             def _update_done():
-                self._update_thread = None
-                self.winfo_toplevel().configure(cursor='')
+                self._update_running = False
+                if self._update_pending:
+                    # The result is outdated already, start over
+                    self._update_pending = False
+                    self._update_thread_err = None
+                    self.stage_start_update()
+                    return
+
+                self._toplevel.configure(cursor='')
 
                 self._model.stages_ui_updating(False)
 
@@ -194,8 +232,8 @@ class OpticsFrame(ttk.Frame, IStage):
 
             self._model.invoke_on_gui_thread_async(_update_done)
 
-        self._update_thread = Thread(target=_update_thread_fn, daemon=True)
-        self._update_thread.start()
+        self._update_running = True
+        self._model.invoke_on_worker_thread_async(_update_thread_fn)
 
     def stage_ui_init(self):
         self._ui_update_done()
@@ -220,76 +258,80 @@ class OpticsFrame(ttk.Frame, IStage):
         self._ui_preview.configure(state=tk.DISABLED)
 
     def _ui_update_done(self):
-        self._ui_update_start()
+        # Each control gets its final state directly, without disabling it first
+        active = self.stage_is_active()
+        next_active = active and self._model.stage_is_active(self._stage_type_next)
+        mapped = next_active and self._model.lfl is not None
 
-        if self.stage_is_active():
+        if active:
             self._model.stage_enabled(self._stage_type, True)
 
-            self._ui_settings.configure(state=tk.NORMAL)
-            if self._update_from_settings:
-                settings_dlg = self._settings_dlg
-                if settings_dlg is not None:
-                    settings_dlg.enable(True)
-            self._ui_start.configure(state=tk.NORMAL)
-
-            if self._model.stage_is_active(self._stage_type_next):
-                self._ui_preview_mla.configure(state=tk.NORMAL)
-
-                if (self._model.mla.lattice_type
-                        == smlfm.MicroLensArray.LatticeType.HEXAGONAL):
-                    self._ui_preview_mla[IMAGE] = self._model.icons.opt_hexagon
-                elif (self._model.mla.lattice_type
-                      == smlfm.MicroLensArray.LatticeType.SQUARE):
-                    self._ui_preview_mla[IMAGE] = self._model.icons.opt_square
-                # elif (self._model.mla.lattice_type
-                #       == smlfm.MicroLensArray.LatticeType.TRIANGULAR):
-                #     self._ui_preview_mla[IMAGE] = self._model.icons.opt_triangle
-                else:
-                    self._ui_preview_mla[IMAGE] = self._model.icons.opt_dot
-
-                if self._model.lfl is not None:
-                    self._ui_preview.configure(state=tk.NORMAL)
-                    lenses = np.unique(self._model.lfl.locs_2d[:, 12]).shape[0]
-                    self._var_summary.set(f'Localisations mapped to {lenses} lenses')
-                else:
-                    self._var_summary.set('No localisations mapped to lenses')
+        self._ui_settings.configure(state=tk.NORMAL if active else tk.DISABLED)
+        if self._update_from_settings:
+            settings_dlg = self._settings_dlg
+            if settings_dlg is not None:
+                settings_dlg.enable(active)
+        self._ui_start.configure(state=tk.NORMAL if active else tk.DISABLED)
+        self._ui_preview_mla.configure(state=tk.NORMAL if next_active else tk.DISABLED)
+        self._ui_preview.configure(state=tk.NORMAL if mapped else tk.DISABLED)
+
+        if next_active:
+            if (self._model.mla.lattice_type
+                    == smlfm.MicroLensArray.LatticeType.HEXAGONAL):
+                self._ui_preview_mla[IMAGE] = self._model.icons.opt_hexagon
+            elif (self._model.mla.lattice_type
+                  == smlfm.MicroLensArray.LatticeType.SQUARE):
+                self._ui_preview_mla[IMAGE] = self._model.icons.opt_square
+            # elif (self._model.mla.lattice_type
+            #       == smlfm.MicroLensArray.LatticeType.TRIANGULAR):
+            #     self._ui_preview_mla[IMAGE] = self._model.icons.opt_triangle
+            else:
+                self._ui_preview_mla[IMAGE] = self._model.icons.opt_dot
+
+            if mapped:
+                self._var_summary.set(
+                    f'Localisations mapped to {self._lens_count} lenses')
             else:
-                self._var_summary.set('No optics configured')
+                self._var_summary.set('No localisations mapped to lenses')
+        elif active:
+            self._var_summary.set('No optics configured')
         else:
             self._var_summary.set('No optics configured yet')
 
     def _flash_start(self):
         self._flash_stop()
-
-        def _toggle_on():
-            if self._flash_counter is None or self._flash_counter > 0:
-                self._var_start.set(1)
-                self._flash_id = self.after(500, _toggle_off)
-
-        def _toggle_off():
-            self._var_start.set(0)
-            if self._flash_counter is None or self._flash_counter > 0:
-                if self._flash_counter is not None:
-                    self._flash_counter -= 1
-                self._flash_id = self.after(500, _toggle_on)
-
         self._flash_counter = None
-        _toggle_on()
+        self._flash_tick()
 
     def _flash_stop(self):
         self._flash_counter = 0
         if self._flash_id is not None:
             self.after_cancel(self._flash_id)
+            self._flash_id = None
         self._var_start.set(0)
 
+    def _flash_tick(self):
+        self._flash_id = None
+        if self._flash_counter is not None and self._flash_counter <= 0:
+            self._var_start.set(0)
+            return
+        if self._var_start.get():
+            self._var_start.set(0)
+            if self._flash_counter is not None:
+                self._flash_counter -= 1
+        else:
+            self._var_start.set(1)
+        self._flash_id = self.after(500, self._flash_tick)
+
     def _on_settings(self):
-        cfg_dump_old = self._model.cfg.to_json()
+        # The dialog modifies only optics settings, compare them instead of whole JSON dumps
+        cfg_dump_old = self._get_settings_key()
 
         def _process_cb(apply: bool):
             self._settings_apply = apply
             self._update_from_settings = True
             nonlocal cfg_dump_old
-            cfg_dump_new = self._model.cfg.to_json()
+            cfg_dump_new = self._get_settings_key()
             if (cfg_dump_old != cfg_dump_new
                     or not self._model.stage_is_active(self._stage_type_next)):
                 cfg_dump_old = cfg_dump_new
@@ -307,6 +349,9 @@ class OpticsFrame(ttk.Frame, IStage):
             self._update_from_settings = False
         self._var_settings.set(0)
 
+    def _get_settings_key(self) -> tuple:
+        return tuple(getattr(self._model.cfg, name) for name in SETTING_NAMES)
+
     def _on_start(self):
         self._var_start.set(0)
 
@@ -314,10 +359,13 @@ class OpticsFrame(ttk.Frame, IStage):
         self.stage_start_update()
 
     def _show_previews(self, force_update: bool = False):
-        if not self._model.stage_is_active(self._stage_type_next):
+        show = self._model.cfg.show_graphs
+        # Nothing to show or update
+        if not show and not force_update and not self._settings_apply:
             return
 
-        show = self._model.cfg.show_graphs
+        if not self._model.stage_is_active(self._stage_type_next):
+            return
 
         force_show_mla = ((show and self._model.cfg.show_all_debug_graphs)
                           or self._settings_apply)
@@ -337,6 +385,17 @@ class OpticsFrame(ttk.Frame, IStage):
         if force_show_map or force_update_map:
             self._on_preview(force_update_map)
 
+    def _on_preview_wnd_map(self, graph_type: GraphType, mapped: bool, evt: tk.Event):
+        # The binding on toplevel window is triggered for all its child widgets too
+        if evt.widget is not self._model.graphs[graph_type]:
+            return
+
+        var_preview, on_preview = self._previews[graph_type]
+        if var_preview.get() != int(mapped):
+            var_preview.set(int(mapped))
+        if mapped:
+            on_preview()  # Redraw if updated while hidden
+
     def _on_preview_mla(self, force_update: bool = False):
 
         def draw(f: Figure, set_size: bool = True) -> Figure:
@@ -352,15 +411,20 @@ class OpticsFrame(ttk.Frame, IStage):
             fig = draw(Figure())
             wnd = FigureWindow(fig, master=self,
                                title='Micro-lens array centres')
-            wnd.bind('<Map>', func=lambda _evt: self._var_preview_mla.set(1))
-            wnd.bind('<Unmap>', func=lambda _evt: self._var_preview_mla.set(0))
+            wnd.bind('<Map>',
+                     func=partial(self._on_preview_wnd_map, GraphType.MLA, True))
+            wnd.bind('<Unmap>',
+                     func=partial(self._on_preview_wnd_map, GraphType.MLA, False))
             self._model.graphs[GraphType.MLA] = wnd
         else:
             if force_update:
-                draw(wnd.figure, set_size=False)
-                wnd.refresh()
+                self._dirty_graphs.add(GraphType.MLA)
 
         if self._var_preview_mla.get():
+            if GraphType.MLA in self._dirty_graphs:
+                self._dirty_graphs.discard(GraphType.MLA)
+                draw(wnd.figure, set_size=False)
+                wnd.refresh()
             wnd.deiconify()
         else:
             wnd.withdraw()
@@ -372,38 +436,39 @@ class OpticsFrame(ttk.Frame, IStage):
                 f,
                 xy=self._model.lfl.locs_2d[:, 3:5],
                 lens_idx=self._model.lfl.locs_2d[:, 12],
-                lens_centres=((self._model.mla.lens_centres - self._model.mla.centre)
-                              * self._model.lfm.mla_to_xy_scale),
+                lens_centres=self._model.xy_lens_centres,
                 # U,V values are around MLA centre but that offset is not included
                 # mla_centre=self._model.mla.centre,
                 mla_centre=np.array([0.0, 0.0]),
-                bfp_radius=((self._model.lfm.bfp_radius / self._model.mla.lens_pitch)
-                            * self._model.lfm.mla_to_xy_scale),
-                set_default_size=set_size)
+                bfp_radius=self._xy_bfp_radius,
+                set_default_size=set_size,
+                max_points=self._model.cfg.show_mla_alignment_max_points)
 
         wnd = self._model.graphs[GraphType.MAPPED]
         if wnd is None:
             fig = draw(Figure())
             wnd = FigureWindow(fig, master=self,
                                title='Localisations with lens centers')
-            wnd.bind('<Map>', func=lambda _evt: self._var_preview.set(1))
-            wnd.bind('<Unmap>', func=lambda _evt: self._var_preview.set(0))
+            wnd.bind('<Map>',
+                     func=partial(self._on_preview_wnd_map, GraphType.MAPPED, True))
+            wnd.bind('<Unmap>',
+                     func=partial(self._on_preview_wnd_map, GraphType.MAPPED, False))
             self._model.graphs[GraphType.MAPPED] = wnd
         else:
             if force_update:
-                draw(wnd.figure, set_size=False)
-                wnd.refresh()
+                self._dirty_graphs.add(GraphType.MAPPED)
 
         if self._var_preview.get():
+            if GraphType.MAPPED in self._dirty_graphs:
+                self._dirty_graphs.discard(GraphType.MAPPED)
+                draw(wnd.figure, set_size=False)
+                wnd.refresh()
             wnd.deiconify()
         else:
             wnd.withdraw()
 
     # Executed on thread
     def _update_task(self):
-        self._model.invoke_on_gui_thread_async(
-            self._var_summary.set, 'Configuring optics...')
-
         self._model.lfm = smlfm.FourierMicroscope(
             self._model.cfg.num_aperture,
             self._model.cfg.mla_lens_pitch,
@@ -422,25 +487,32 @@ class OpticsFrame(ttk.Frame, IStage):
             self._model.cfg.mla_optic_size,
             np.array(self._model.cfg.mla_centre))
 
-        self._model.mla.rotate_lattice(np.deg2rad(self._model.cfg.mla_rotation))
-        self._model.mla.offset_lattice(
+        self._model.mla.transform_lattice(
+            np.deg2rad(self._model.cfg.mla_rotation),
             np.array(self._model.cfg.mla_offset) / self._model.lfm.mla_to_xy_scale)  # XY -> MLA
 
         self._model.invoke_on_gui_thread_async(
             self._var_summary.set, 'Mapping to lenses...')
-        tic = time.time()
+        tic = time.perf_counter()
 
         self._model.csv.scale_peakfit_data(self._model.lfm.pixel_size_sample)
-        locs_2d = self._model.csv.data.copy()
-
-        # Center X and Y to their means
+        # The constructor copies the data to a new array, no need to copy it here.
+        # Center X and Y to their means as part of that copy.
         # TODO: Why center the data to means? Ensure how is this related to MLA centre.
-        locs_2d[:, 1] -= locs_2d[:, 1].mean()
-        locs_2d[:, 2] -= locs_2d[:, 2].mean()
+        self._model.lfl = smlfm.Localisations(self._model.csv.data, centre_xy=True)
 
-        self._model.lfl = smlfm.Localisations(locs_2d)
         self._model.lfl.assign_to_lenses(self._model.mla, self._model.lfm)
+        # Lens indices are small non-negative integers, no need to sort them
+        lens_idx = self._model.lfl.locs_2d[:, 12].astype(np.intp)
+        self._lens_count = int(np.count_nonzero(np.bincount(lens_idx)))
+
+        # Scaled in place, without another temporary array
+        xy_lens_centres = self._model.mla.lens_centres - self._model.mla.centre
+        xy_lens_centres *= self._model.lfm.mla_to_xy_scale
+        self._model.xy_lens_centres = xy_lens_centres
+        self._xy_bfp_radius = ((self._model.lfm.bfp_radius / self._model.mla.lens_pitch)
+                               * self._model.lfm.mla_to_xy_scale)
 
         if self._model.cfg.log_timing:
             print(f'Mapping points to lenses took'
-                  f' {1e3 * (time.time() - tic):.3f} ms')
+                  f' {1e3 * (time.perf_counter() - tic):.3f} ms')
@@ -0,0 +1,109 @@
+import tkinter as tk
+from typing import Dict, Optional
+
+
+class SharedTooltip:
+    """A single tooltip window shared by many widgets.
+
+    It behaves like `idlelib.tooltip.Hovertip`, but instead of creating own
+    event bindings and tooltip window for every widget, all registered widgets
+    get one common bind tag, and the tooltip window is created only once and
+    then just hidden or shown with text of the widget under the mouse cursor.
+    """
+
+    def __init__(self, master: tk.Misc, hover_delay: int = 1000):
+        """Initialize a tooltip.
+
+        Args:
+            master (tk.Misc): A parent widget, usually a dialog window.
+            hover_delay (int): A time to delay before showing the tooltip,
+                in milliseconds.
+        """
+
+        self._master = master
+        self._hover_delay = hover_delay
+        self._texts: Dict[str, str] = {}  # Key is a widget path name
+        self._tip_wnd: Optional[tk.Toplevel] = None
+        self._tip_label: Optional[tk.Label] = None
+        self._after_id: Optional[str] = None
+
+        self._bind_tag = f'SharedTooltip{id(self)}'
+        master.bind_class(self._bind_tag, '<Enter>', self._on_enter)
+        master.bind_class(self._bind_tag, '<Leave>', self._on_leave)
+        master.bind_class(self._bind_tag, '<Button>', self._on_leave)
+
+    def register(self, widget: tk.Misc, text: str) -> None:
+        """Show given text in the tooltip when mouse hovers over the widget."""
+        if str(widget) not in self._texts:
+            widget.bindtags(widget.bindtags() + (self._bind_tag,))
+        self._texts[str(widget)] = text
+
+    def show_for(self, widget: tk.Misc) -> None:
+        """Show the tooltip of given widget immediately."""
+        self._unschedule()
+        text = self._texts.get(str(widget))
+        if text is None:
+            return
+
+        if self._tip_wnd is None:
+            self._tip_wnd = tk.Toplevel(self._master)
+            self._tip_wnd.wm_overrideredirect(True)
+            try:
+                # Only needed and available on macOS, see `idlelib.tooltip`
+                self._tip_wnd.tk.call('::tk::unsupported::MacWindowStyle', 'style',
+                                      self._tip_wnd, 'help', 'noActivates')
+            except tk.TclError:
+                pass
+            self._tip_label = tk.Label(self._tip_wnd, justify=tk.LEFT,
+                                       background='#ffffe0', relief=tk.SOLID,
+                                       borderwidth=1)
+            self._tip_label.pack()
+
+        self._tip_label.configure(text=text)
+        # The tooltip must be completely outside the widget, otherwise
+        # the mouse entering the tooltip would hide it again
+        self._tip_wnd.wm_geometry(f'+{widget.winfo_rootx() + 20}'
+                                  f'+{widget.winfo_rooty() + widget.winfo_height() + 1}')
+        self._tip_wnd.deiconify()
+        self._tip_wnd.lift()
+
+    def hide(self) -> None:
+        """Hide the tooltip, if shown."""
+        self._unschedule()
+        if self._tip_wnd is not None:
+            try:
+                self._tip_wnd.withdraw()
+            except tk.TclError:
+                pass
+
+    def destroy(self) -> None:
+        """Release the tooltip window and event bindings."""
+        self._unschedule()
+        for sequence in ('<Enter>', '<Leave>', '<Button>'):
+            self._master.unbind_class(self._bind_tag, sequence)
+        if self._tip_wnd is not None:
+            try:
+                self._tip_wnd.destroy()
+            except tk.TclError:
+                pass
+            self._tip_wnd = None
+            self._tip_label = None
+        self._texts = {}
+
+    def _on_enter(self, evt: tk.Event) -> None:
+        self._unschedule()
+        if self._hover_delay:
+            widget = evt.widget
+            self._after_id = self._master.after(
+                self._hover_delay, lambda: self.show_for(widget))
+        else:
+            self.show_for(evt.widget)
+
+    def _on_leave(self, _evt: tk.Event) -> None:
+        self.hide()
+
+    def _unschedule(self) -> None:
+        after_id = self._after_id
+        self._after_id = None
+        if after_id is not None:
+            self._master.after_cancel(after_id)
@@ -8,6 +8,14 @@ import pytest
 import smlfm
 
 
+@pytest.fixture(scope='module')
+def cfg1():
+    # Parsed once for all parametrisations, the tests only read it
+    cfg1_dump = pkgutil.get_data(
+        smlfm.__name__, 'data/default-config.json').decode()
+    return smlfm.Config.from_json(cfg1_dump)
+
+
 @pytest.mark.parametrize(
     "indents",
     (
@@ -16,11 +24,8 @@ import smlfm
         pytest.param(4),
     ),
 )
-def test_config(indents):
-    cfg1_dump = pkgutil.get_data(
-        smlfm.__name__, 'data/default-config.json').decode()
-    cfg1 = smlfm.Config.from_json(cfg1_dump)
-
+def test_config(cfg1, indents):
+    # pylint: disable=redefined-outer-name
     # Deserialization should result in exactly same data types and values
     cfg2_dump = cfg1.to_json(indent=indents)
     cfg2 = smlfm.Config.from_json(cfg2_dump)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+import smlfm
+
+
+@pytest.mark.parametrize(
+    "frames, expected",
+    (
+        pytest.param([], 0),
+        pytest.param([np.nan], 0),
+        pytest.param([5.0], 1),
+        pytest.param([3.0, 1.0, 3.0, 2.0, 1.0], 3),
+        pytest.param([-2.0, 0.0, -2.0, 7.0], 3),
+        pytest.param([1.0, np.nan, 2.0, np.inf, 2.0, -np.inf], 2),
+        pytest.param([1.0, 1e15, 1e15, 3e17], 3),
+    ),
+)
+def test_count_unique_frames(frames, expected):
+    assert smlfm.count_unique_frames(np.array(frames, dtype=float)) == expected
+
+
+def test_count_unique_frames_random():
+    rng = np.random.default_rng(0)
+    for high in (10, 1000, 10**9):
+        frames = rng.integers(0, high, 5000).astype(float)
+        assert smlfm.count_unique_frames(frames) == np.unique(frames).shape[0]
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+from sklearn.neighbors import NearestNeighbors
+
+import smlfm
+import smlfm.localisations
+
+# The tests check the lattice lookup inside `assign_to_lenses()` directly too
+# pylint: disable=protected-access
+
+
+def _create_optics(lattice_type, theta=0.0, dxy=(0.0, 0.0)):
+    cfg = smlfm.Config()
+    lfm = smlfm.FourierMicroscope(
+        cfg.num_aperture, cfg.mla_lens_pitch,
+        cfg.focal_length_mla, cfg.focal_length_obj_lens,
+        cfg.focal_length_tube_lens, cfg.focal_length_fourier_lens,
+        cfg.pixel_size_camera, cfg.ref_idx_immersion, cfg.ref_idx_medium)
+    mla = smlfm.MicroLensArray(
+        lattice_type, cfg.focal_length_mla, cfg.mla_lens_pitch,
+        cfg.mla_optic_size, np.array(cfg.mla_centre))
+    mla.rotate_lattice(theta)
+    mla.offset_lattice(np.array(dxy))
+    return lfm, mla
+
+
+def _create_locs(lfm, mla, count=20000, seed=0):
+    # Points spread over the whole array and well beyond its border
+    lens_centres = (mla.lens_centres - mla.centre) * lfm.mla_to_xy_scale
+    extent = 1.5 * np.max(np.abs(lens_centres))
+    rng = np.random.default_rng(seed)
+    locs_2d_csv = np.zeros((count, 8))
+    locs_2d_csv[:, 0] = rng.integers(1, 100, count)  # Frame
+    locs_2d_csv[:, 1:3] = rng.uniform(-extent, extent, (count, 2))  # X, Y
+    locs_2d_csv[:, 3:8] = rng.uniform(0.1, 1.0, (count, 5))
+    return locs_2d_csv
+
+
+def _nearest_lenses(lfm, mla, locs_2d_csv):
+    lens_centres = (mla.lens_centres - mla.centre) * lfm.mla_to_uv_scale
+    uv = locs_2d_csv[:, 1:3] * lfm.xy_to_uv_scale
+    knn = NearestNeighbors(n_neighbors=1).fit(lens_centres)
+    return knn.kneighbors(uv, return_distance=False)[:, 0], lens_centres
+
+
+def _assert_assigned(lfm, mla, locs_2d_csv):
+    expected_idx, lens_centres = _nearest_lenses(lfm, mla, locs_2d_csv)
+
+    lfl = smlfm.Localisations(locs_2d_csv)
+    lfl.assign_to_lenses(mla, lfm)
+
+    np.testing.assert_array_equal(lfl.locs_2d[:, 12], expected_idx)
+    np.testing.assert_array_equal(lfl.locs_2d[:, 1:3], lens_centres[expected_idx, :])
+
+
+@pytest.mark.parametrize(
+    "lattice_type",
+    (
+        pytest.param(smlfm.MicroLensArray.LatticeType.SQUARE),
+        pytest.param(smlfm.MicroLensArray.LatticeType.HEXAGONAL),
+    ),
+)
+@pytest.mark.parametrize(
+    "theta, dxy",
+    (
+        pytest.param(0.0, (0.0, 0.0)),
+        pytest.param(np.deg2rad(30.8), (0.0, 0.0)),
+        pytest.param(np.deg2rad(-12.3), (0.37, -0.21)),
+    ),
+)
+def test_assign_to_lenses(monkeypatch, lattice_type, theta, dxy):
+    monkeypatch.setattr(smlfm.localisations, '_HAS_NUMBA', False)
+    lfm, mla = _create_optics(lattice_type, theta, dxy)
+    locs_2d_csv = _create_locs(lfm, mla)
+
+    # Points beyond the array border are resolved by the KD-tree fallback
+    _, lens_centres = _nearest_lenses(lfm, mla, locs_2d_csv)
+    lattice_idx = smlfm.Localisations._nearest_lens_on_lattice(
+        locs_2d_csv[:, 1:3] * lfm.xy_to_uv_scale, lens_centres)
+    assert lattice_idx is not None
+    assert np.any(lattice_idx < 0)
+    assert np.any(lattice_idx >= 0)
+
+    _assert_assigned(lfm, mla, locs_2d_csv)
+
+
+@pytest.mark.parametrize(
+    "lattice_type",
+    (
+        pytest.param(smlfm.MicroLensArray.LatticeType.SQUARE),
+        pytest.param(smlfm.MicroLensArray.LatticeType.HEXAGONAL),
+    ),
+)
+@pytest.mark.parametrize(
+    "irregularity",
+    (
+        pytest.param('jitter'),
+        pytest.param('missing_lens'),
+    ),
+)
+def test_assign_to_lenses_irregular(monkeypatch, lattice_type, irregularity):
+    monkeypatch.setattr(smlfm.localisations, '_HAS_NUMBA', False)
+    lfm, mla = _create_optics(lattice_type, np.deg2rad(30.8))
+    if irregularity == 'jitter':
+        rng = np.random.default_rng(1)
+        mla.lens_centres += rng.uniform(-0.05, 0.05, mla.lens_centres.shape)
+    else:
+        mla.lens_centres = mla.lens_centres[1:, :]
+    locs_2d_csv = _create_locs(lfm, mla)
+
+    # Not a regular lattice, all points are resolved by the KD-tree fallback
+    _, lens_centres = _nearest_lenses(lfm, mla, locs_2d_csv)
+    lattice_idx = smlfm.Localisations._nearest_lens_on_lattice(
+        locs_2d_csv[:, 1:3] * lfm.xy_to_uv_scale, lens_centres)
+    assert lattice_idx is None
+
+    _assert_assigned(lfm, mla, locs_2d_csv)
+
+
+@pytest.mark.parametrize(
+    "b2",
+    (
+        pytest.param((-0.6, 0.9)),
+        pytest.param((-1.6, 0.4)),
+        pytest.param((-3.3, 0.2)),
+        pytest.param((7.2, 0.3)),
+    ),
+)
+def test_assign_to_lenses_skewed(monkeypatch, b2):
+    monkeypatch.setattr(smlfm.localisations, '_HAS_NUMBA', False)
+    lfm, mla = _create_optics(smlfm.MicroLensArray.LatticeType.SQUARE)
+    # A regular lattice given by long and skewed grid vectors
+    n = 7
+    i, j = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    grid_ij = np.column_stack((i.flatten(), j.flatten()))
+    mla.lens_centres = grid_ij @ np.array([[1.0, 0.0], b2]) + np.array([-3.1, 0.4])
+    locs_2d_csv = _create_locs(lfm, mla)
+
+    _, lens_centres = _nearest_lenses(lfm, mla, locs_2d_csv)
+    lattice_idx = smlfm.Localisations._nearest_lens_on_lattice(
+        locs_2d_csv[:, 1:3] * lfm.xy_to_uv_scale, lens_centres)
+    assert lattice_idx is not None
+    assert np.any(lattice_idx >= 0)
+
+    _assert_assigned(lfm, mla, locs_2d_csv)
+
+
+@pytest.mark.parametrize(
+    "lattice_type",
+    (
+        pytest.param(smlfm.MicroLensArray.LatticeType.SQUARE),
+        pytest.param(smlfm.MicroLensArray.LatticeType.HEXAGONAL),
+    ),
+)
+@pytest.mark.parametrize(
+    "theta, dxy",
+    (
+        pytest.param(0.0, (0.0, 0.0)),
+        pytest.param(np.deg2rad(30.8), (0.0, 0.0)),
+        pytest.param(np.deg2rad(-12.3), (0.37, -0.21)),
+    ),
+)
+def test_assign_to_lenses_numba(monkeypatch, lattice_type, theta, dxy):
+    pytest.importorskip('numba')
+    lfm, mla = _create_optics(lattice_type, theta, dxy)
+    locs_2d_csv = _create_locs(lfm, mla)
+
+    # The same data mapped by Numba kernel and by NumPy code
+    monkeypatch.setattr(smlfm.localisations, '_HAS_NUMBA', True)
+    lfl_numba = smlfm.Localisations(locs_2d_csv)
+    lfl_numba.assign_to_lenses(mla, lfm)
+    monkeypatch.setattr(smlfm.localisations, '_HAS_NUMBA', False)
+    lfl_numpy = smlfm.Localisations(locs_2d_csv)
+    lfl_numpy.assign_to_lenses(mla, lfm)
+
+    np.testing.assert_array_equal(lfl_numba.locs_2d[:, 12], lfl_numpy.locs_2d[:, 12])
+    np.testing.assert_array_equal(lfl_numba.locs_2d[:, 1:3], lfl_numpy.locs_2d[:, 1:3])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+import smlfm
+
+
+def _create_mla(lattice_type):
+    cfg = smlfm.Config()
+    return smlfm.MicroLensArray(
+        lattice_type, cfg.focal_length_mla, cfg.mla_lens_pitch,
+        cfg.mla_optic_size, np.array([0.3, -0.2]))
+
+
+@pytest.mark.parametrize(
+    "lattice_type",
+    (
+        pytest.param(smlfm.MicroLensArray.LatticeType.SQUARE),
+        pytest.param(smlfm.MicroLensArray.LatticeType.HEXAGONAL),
+    ),
+)
+@pytest.mark.parametrize(
+    "theta, dxy",
+    (
+        pytest.param(0.0, (0.0, 0.0)),
+        pytest.param(np.deg2rad(30.8), (0.0, 0.0)),
+        pytest.param(0.0, (0.37, -0.21)),
+        pytest.param(np.deg2rad(-12.3), (0.37, -0.21)),
+    ),
+)
+def test_transform_lattice(lattice_type, theta, dxy):
+    mla1 = _create_mla(lattice_type)
+    mla1.rotate_lattice(theta)
+    mla1.offset_lattice(np.array(dxy))
+
+    mla2 = _create_mla(lattice_type)
+    mla2.transform_lattice(theta, np.array(dxy))
+
+    # Same up to rounding, the operations are done in different order
+    np.testing.assert_allclose(mla2.lens_centres, mla1.lens_centres, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(mla2.centre, mla1.centre)